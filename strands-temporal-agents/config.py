@@ -8,6 +8,10 @@ TASK_QUEUE = "strands-temporal-agent-queue"
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 BEDROCK_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-20250514-v1:0")
 
+# Cache static system prompts/tool schemas in Bedrock so repeat calls skip
+# re-evaluating the shared prefix (only effective on cache-capable models)
+BEDROCK_PROMPT_CACHE = os.getenv("BEDROCK_PROMPT_CACHE", "true").lower() == "true"
+
 # Docker configuration
 DOCKER_HOST = os.getenv("DOCKER_HOST", "unix:///var/run/docker.sock")
 DOCKER_TIMEOUT = int(os.getenv("DOCKER_TIMEOUT", "30"))
@@ -22,6 +26,10 @@ LOG_RETRIEVAL_TIMEOUT = 10
 RESTART_TIMEOUT = 30
 AI_ORCHESTRATOR_TIMEOUT = 15
 
+# Start a speculative status check while the AI orchestrator is planning
+# (costs one extra Docker call when the plan doesn't need status)
+SPECULATIVE_STATUS_PREFETCH = os.getenv("SPECULATIVE_STATUS_PREFETCH", "true").lower() == "true"
+
 # Resource thresholds for health checks
 CPU_THRESHOLD_PERCENT = 90.0
 MEMORY_THRESHOLD_PERCENT = 90.0
@@ -0,0 +1,226 @@
+"""Async Docker utilities built on aiodocker so activities never block the worker loop."""
+
+import sys
+from pathlib import Path
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+import aiohttp
+import aiodocker
+from ciso8601 import parse_datetime
+from aiodocker.exceptions import DockerError
+from aiodocker.utils import clean_filters
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import (
+    CPU_THRESHOLD_PERCENT,
+    MEMORY_THRESHOLD_PERCENT,
+    RESTART_COUNT_THRESHOLD
+)
+from docker_monitor.docker_utils import (
+    ContainerInfo,
+    HealthStatus,
+    DockerConnectionError,
+    ContainerNotFoundError,
+    list_entry_to_info
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_docker_time(value: str) -> Optional[datetime]:
+    """Parse Docker's RFC 3339 timestamps, treating the zero value as unset."""
+    if value and value != '0001-01-01T00:00:00Z':
+        return parse_datetime(value)
+    return None
+
+
+class AioDockerClientWrapper:
+    """Async counterpart of DockerClientWrapper.
+
+    All calls multiplex on one aiohttp session to the Docker socket, so
+    concurrent operations (e.g. a health-check fanout) don't need threads.
+    """
+
+    def __init__(self):
+        self.docker = aiodocker.Docker()
+
+    async def close(self):
+        await self.docker.close()
+
+    async def get_containers(self, all: bool = True, filters: dict = None) -> List[ContainerInfo]:
+        """Get list of containers with optional filtering."""
+        try:
+            containers = await self.docker.containers.list(
+                all=all, filters=clean_filters(filters), size=False
+            )
+            return [list_entry_to_info(c._container) for c in containers]
+        except (DockerError, aiohttp.ClientError, OSError) as e:
+            logger.error(f"Failed to list containers: {e}")
+            raise DockerConnectionError(
+                "Failed to retrieve container list from Docker daemon"
+            ) from e
+
+    async def _get(self, container_name: str):
+        """Look up a container by name or id, inspecting it in one call."""
+        try:
+            return await self.docker.containers.get(container_name)
+        except DockerError as e:
+            if e.status == 404:
+                logger.error(f"Container not found: {container_name}")
+                raise ContainerNotFoundError(container_name) from e
+            raise
+
+    async def get_container_logs(self, container_name: str, lines: int = 100, since: str = None) -> str:
+        """Retrieve logs from a container."""
+        try:
+            container = await self._get(container_name)
+
+            log_kwargs = {'stdout': True, 'stderr': True, 'tail': lines, 'timestamps': True}
+            if since:
+                log_kwargs['since'] = since
+
+            log_lines = await container.log(**log_kwargs)
+            return "".join(log_lines) if log_lines else ""
+
+        except ContainerNotFoundError:
+            raise
+        except (DockerError, aiohttp.ClientError, OSError) as e:
+            logger.error(f"Failed to retrieve logs for {container_name}: {e}")
+            raise DockerConnectionError(
+                f"Failed to retrieve logs from container '{container_name}'"
+            ) from e
+
+    async def restart_container(self, container_name: str, timeout: int = 10) -> bool:
+        """Restart a container."""
+        try:
+            container = await self._get(container_name)
+            await container.restart(t=timeout)
+
+            state = (await container.show()).get('State', {})
+            if state.get('Status') == 'running':
+                logger.info(f"Successfully restarted container: {container_name}")
+                return True
+
+            logger.warning(f"Container {container_name} restarted but status is: {state.get('Status')}")
+            return False
+
+        except ContainerNotFoundError:
+            raise
+        except (DockerError, aiohttp.ClientError, OSError) as e:
+            logger.error(f"Failed to restart container {container_name}: {e}")
+            raise DockerConnectionError(
+                f"Failed to restart container '{container_name}'"
+            ) from e
+
+    async def check_many_health(self, container_names: List[str], max_concurrency: int = 32,
+                                include_stats: bool = True):
+        """Check several containers concurrently over the shared socket session.
+
+        Issues all inspect/stats requests in parallel, capped by a semaphore
+        so a large fleet can't flood dockerd. Returns one HealthStatus (or
+        the raised exception) per name, preserving input order. include_stats
+        is passed through to each check, letting sweeps that mainly need
+        verdicts skip the stats call for containers the cheap checks have
+        already decided are unhealthy.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def check_one(name):
+            async with semaphore:
+                return await self.check_container_health(name, include_stats=include_stats)
+
+        return await asyncio.gather(
+            *(check_one(name) for name in container_names),
+            return_exceptions=True
+        )
+
+    async def check_container_health(self, container_name: str,
+                                     include_stats: bool = True) -> HealthStatus:
+        """Check comprehensive health status of a container including resource usage.
+
+        With include_stats=False the stats call is skipped once the cheap
+        checks have already decided the container is unhealthy.
+        """
+        try:
+            container = await self._get(container_name)
+            attrs = container._container
+
+            issues = []
+            is_healthy = True
+
+            state = attrs.get('State', {})
+            status = state.get('Status', 'unknown')
+            if status != 'running':
+                is_healthy = False
+                issues.append(f"Container is {status}, not running")
+
+            health_check_status = None
+            health = state.get('Health', {})
+            if health:
+                health_check_status = health.get('Status', 'none')
+                if health_check_status == 'unhealthy':
+                    is_healthy = False
+                    issues.append("Docker health check reports unhealthy")
+
+            restart_count = state.get('RestartCount', 0)
+            if restart_count >= RESTART_COUNT_THRESHOLD:
+                is_healthy = False
+                issues.append(f"High restart count: {restart_count}")
+
+            last_restart = _parse_docker_time(state.get('StartedAt', ''))
+
+            cpu_percent = None
+            memory_percent = None
+            # Stopped containers report no usage; skip the stats call and
+            # its sampling window entirely, likewise when the caller doesn't
+            # need numbers and the cheap checks already decided.
+            if status == 'running' and (include_stats or is_healthy):
+                try:
+                    stats_list = await container.stats(stream=False)
+                    stats = stats_list[0]
+
+                    cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
+                               stats['precpu_stats']['cpu_usage']['total_usage']
+                    system_delta = stats['cpu_stats']['system_cpu_usage'] - \
+                                  stats['precpu_stats']['system_cpu_usage']
+                    cpu_count = stats['cpu_stats'].get('online_cpus', 1)
+
+                    if system_delta > 0:
+                        cpu_percent = (cpu_delta / system_delta) * cpu_count * 100.0
+                        if cpu_percent > CPU_THRESHOLD_PERCENT:
+                            is_healthy = False
+                            issues.append(f"High CPU usage: {cpu_percent:.1f}%")
+
+                    memory_usage = stats['memory_stats'].get('usage', 0)
+                    memory_limit = stats['memory_stats'].get('limit', 1)
+                    memory_percent = (memory_usage / memory_limit) * 100.0
+                    if memory_percent > MEMORY_THRESHOLD_PERCENT:
+                        is_healthy = False
+                        issues.append(f"High memory usage: {memory_percent:.1f}%")
+
+                except (KeyError, IndexError, ZeroDivisionError) as e:
+                    logger.debug(f"Could not calculate resource usage for {container_name}: {e}")
+
+            return HealthStatus(
+                container_name=attrs.get('Name', container_name).lstrip('/'),
+                is_healthy=is_healthy,
+                status=status,
+                health_check_status=health_check_status,
+                cpu_percent=cpu_percent,
+                memory_percent=memory_percent,
+                restart_count=restart_count,
+                last_restart=last_restart,
+                issues=issues
+            )
+
+        except ContainerNotFoundError:
+            raise
+        except (DockerError, aiohttp.ClientError, OSError) as e:
+            logger.error(f"Failed to check health for {container_name}: {e}")
+            raise DockerConnectionError(
+                f"Failed to check health for container '{container_name}'"
+            ) from e
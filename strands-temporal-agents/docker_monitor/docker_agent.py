@@ -1,6 +1,7 @@
 """Simple Docker Container Health Monitor Agent using Strands framework."""
 
 import logging
+import re
 import sys
 from pathlib import Path
 
@@ -27,6 +28,43 @@ except DockerConnectionError as e:
     logger.error(f"Failed to initialize Docker client: {e}")
     docker_client = None
 
+# No trailing \b so WARN also matches WARNING, like the old substring check.
+# Bytes pattern: the log blob is scanned without ever decoding it wholesale.
+_LOG_LEVEL_RE = re.compile(rb'\b(INFO|WARN|ERROR|DEBUG)', re.IGNORECASE)
+
+# Matched level token (in whatever casing the log uses) -> canonical name.
+# Filled lazily so each casing pays for upper()+decode() only once per process.
+_LEVEL_CANON = {}
+
+
+def _scan_log_levels(blob: bytes):
+    """Single C-level scan over a raw log blob.
+
+    Returns per-line level counts and the decoded error lines. Counts are
+    per line, not per match — a stack trace mentioning ERROR twice is still
+    one error — matching the per-line substring semantics of the original
+    line loop, and only the error lines ever get decoded.
+    """
+    level_counts = {'INFO': 0, 'WARN': 0, 'ERROR': 0, 'DEBUG': 0}
+    error_lines = []
+    last_counted = dict.fromkeys(level_counts, -1)
+    for match in _LOG_LEVEL_RE.finditer(blob):
+        token = match.group(1)
+        level = _LEVEL_CANON.get(token)
+        if level is None:
+            level = _LEVEL_CANON.setdefault(token, token.upper().decode('ascii'))
+        line_start = blob.rfind(b'\n', 0, match.start()) + 1
+        if line_start == last_counted[level]:
+            continue
+        last_counted[level] = line_start
+        level_counts[level] += 1
+        if level == 'ERROR':
+            line_end = blob.find(b'\n', match.end())
+            if line_end == -1:
+                line_end = len(blob)
+            error_lines.append(blob[line_start:line_end].decode('utf-8', errors='replace'))
+    return level_counts, error_lines
+
 
 @tool
 def get_container_status(filter_by: str = None) -> str:
@@ -78,18 +116,18 @@ def check_container_health(container_name: str = None) -> str:
         
         results = [f"Health check for {len(containers)} running container(s):\n"]
         healthy_count = 0
-        
-        for container in containers:
-            try:
-                health = docker_client.check_container_health(container.name)
-                results.append(health.format_summary())
-                results.append("")
-                if health.is_healthy:
-                    healthy_count += 1
-            except Exception as e:
-                results.append(f"✗ {container.name}: Error checking health - {str(e)}")
-                results.append("")
-        
+
+        # Batch path: one listing plus cached/one-shot stats per container,
+        # with the threshold arithmetic done as NumPy array passes instead
+        # of per-container Python math on a thread pool.
+        for health in docker_client.check_many_health_vectorized(
+            [container.name for container in containers]
+        ):
+            results.append(health.format_summary())
+            results.append("")
+            if health.is_healthy:
+                healthy_count += 1
+
         results.append(f"Summary: {healthy_count}/{len(containers)} containers healthy")
         return "\n".join(results)
         
@@ -157,67 +195,83 @@ def analyze_container_logs(container_name: str, lines: int = 100) -> str:
         return "Docker daemon is not accessible. Please ensure Docker is running."
     
     try:
-        logs = docker_client.get_container_logs(container_name, lines=lines)
-        if not logs:
+        blob = docker_client.get_container_log_blob(container_name, lines=lines)
+        if not blob:
             return f"No logs found for container '{container_name}'"
-        
-        log_lines = logs.strip().split('\n')
-        total_lines = len(log_lines)
-        
-        info_count = sum(1 for line in log_lines if 'INFO' in line.upper())
-        warn_count = sum(1 for line in log_lines if 'WARN' in line.upper())
-        error_count = sum(1 for line in log_lines if 'ERROR' in line.upper())
-        debug_count = sum(1 for line in log_lines if 'DEBUG' in line.upper())
-        
-        error_lines = [line for line in log_lines if 'ERROR' in line.upper()]
+
+        total_lines = blob.count(b'\n') + (0 if blob.endswith(b'\n') else 1)
+
+        level_counts, error_lines = _scan_log_levels(blob)
+
+        info_count = level_counts['INFO']
+        warn_count = level_counts['WARN']
+        error_count = level_counts['ERROR']
+        debug_count = level_counts['DEBUG']
+
         recent_errors = error_lines[-5:] if error_lines else []
-        
-        result = [f"Log Analysis for '{container_name}' (last {lines} lines)", "=" * 60, ""]
-        
-        result.append("📊 Log Level Distribution:")
-        result.append(f"  • Total log lines: {total_lines}")
-        result.append(f"  • INFO:  {info_count} ({info_count*100//total_lines if total_lines > 0 else 0}%)")
-        result.append(f"  • WARN:  {warn_count} ({warn_count*100//total_lines if total_lines > 0 else 0}%)")
-        result.append(f"  • ERROR: {error_count} ({error_count*100//total_lines if total_lines > 0 else 0}%)")
-        result.append(f"  • DEBUG: {debug_count} ({debug_count*100//total_lines if total_lines > 0 else 0}%)")
-        result.append("")
-        
+
+        # The empty-blob early return above guarantees total_lines >= 1,
+        # so no per-level zero check is needed.
+        def pct(count: int) -> int:
+            return count * 100 // total_lines
+
         if error_count == 0:
-            result.append("✓ Health: No errors detected in recent logs")
+            health_line = "✓ Health: No errors detected in recent logs"
         elif error_count < 5:
-            result.append(f"⚠ Health: {error_count} error(s) detected - review recommended")
+            health_line = f"⚠ Health: {error_count} error(s) detected - review recommended"
         else:
-            result.append(f"✗ Health: {error_count} errors detected - immediate attention needed")
-        result.append("")
-        
+            health_line = f"✗ Health: {error_count} errors detected - immediate attention needed"
+
+        errors_block = ""
         if recent_errors:
-            result.append(f"🔴 Recent Errors (last {len(recent_errors)}):")
-            for i, error in enumerate(recent_errors, 1):
-                error_preview = error[:100] + "..." if len(error) > 100 else error
-                result.append(f"  {i}. {error_preview}")
-            result.append("")
-        
-        result.append("📝 Activity Summary:")
-        if total_lines > 0:
-            first_line = log_lines[0][:80] + "..." if len(log_lines[0]) > 80 else log_lines[0]
-            last_line = log_lines[-1][:80] + "..." if len(log_lines[-1]) > 80 else log_lines[-1]
-            result.append(f"  • First log: {first_line}")
-            result.append(f"  • Last log:  {last_line}")
-        result.append("")
-        
-        result.append("💡 Recommendations:")
+            numbered = "\n".join(
+                f"  {i}. {error[:100] + '...' if len(error) > 100 else error}"
+                for i, error in enumerate(recent_errors, 1)
+            )
+            errors_block = f"🔴 Recent Errors (last {len(recent_errors)}):\n{numbered}\n\n"
+
+        first_end = blob.find(b'\n')
+        first_log = (blob if first_end == -1 else blob[:first_end]).decode('utf-8', errors='replace')
+        trimmed = blob.rstrip(b'\n')
+        last_log = trimmed[trimmed.rfind(b'\n') + 1:].decode('utf-8', errors='replace')
+        first_line = first_log[:80] + "..." if len(first_log) > 80 else first_log
+        last_line = last_log[:80] + "..." if len(last_log) > 80 else last_log
+        activity_block = f"  • First log: {first_line}\n  • Last log:  {last_line}\n"
+
         if error_count > 10:
-            result.append("  • High error rate detected - investigate root cause")
-            result.append("  • Consider restarting the container if errors persist")
+            recommendations = [
+                "  • High error rate detected - investigate root cause",
+                "  • Consider restarting the container if errors persist"
+            ]
         elif error_count > 0:
-            result.append("  • Review error messages above for specific issues")
+            recommendations = ["  • Review error messages above for specific issues"]
         else:
-            result.append("  • Container logs look healthy")
-        
+            recommendations = ["  • Container logs look healthy"]
+
         if warn_count > total_lines * 0.3:
-            result.append("  • High warning rate - may indicate configuration issues")
-        
-        return "\n".join(result)
+            recommendations.append("  • High warning rate - may indicate configuration issues")
+        recommendations_block = "\n".join(recommendations)
+
+        return (
+            f"Log Analysis for '{container_name}' (last {lines} lines)\n"
+            f"{'=' * 60}\n"
+            "\n"
+            "📊 Log Level Distribution:\n"
+            f"  • Total log lines: {total_lines}\n"
+            f"  • INFO:  {info_count} ({pct(info_count)}%)\n"
+            f"  • WARN:  {warn_count} ({pct(warn_count)}%)\n"
+            f"  • ERROR: {error_count} ({pct(error_count)}%)\n"
+            f"  • DEBUG: {debug_count} ({pct(debug_count)}%)\n"
+            "\n"
+            f"{health_line}\n"
+            "\n"
+            f"{errors_block}"
+            "📝 Activity Summary:\n"
+            f"{activity_block}"
+            "\n"
+            "💡 Recommendations:\n"
+            f"{recommendations_block}"
+        )
         
     except ContainerNotFoundError as e:
         return f"Container '{e.container_name}' not found"
@@ -256,7 +310,16 @@ def main():
         print("ERROR: Could not connect to Docker daemon.")
         print("Please ensure Docker is running and try again.")
         return
-    
+
+    try:
+        # The wrapper connects lazily; touch the client here so the banner
+        # below reports a connection that actually happened.
+        docker_client.client
+    except DockerConnectionError:
+        print("ERROR: Could not connect to Docker daemon.")
+        print("Please ensure Docker is running and try again.")
+        return
+
     print("Connected to Docker daemon successfully!")
     print()
     print("Example queries:")
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import uuid
 from temporalio.client import Client
+from temporalio.service import KeepAliveConfig
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -31,7 +32,12 @@ async def main():
     
     try:
         print(f"Connecting to Temporal server at {TEMPORAL_HOST}...")
-        client = await Client.connect(TEMPORAL_HOST)
+        # Explicit gRPC keepalive so the long-lived REPL connection doesn't
+        # go idle and pay a reconnect handshake on the next task.
+        client = await Client.connect(
+            TEMPORAL_HOST,
+            keep_alive_config=KeepAliveConfig(interval_millis=30000, timeout_millis=15000)
+        )
         print("✓ Connected to Temporal server")
         print()
         
@@ -54,10 +60,15 @@ async def main():
     print("=" * 60)
     print()
     
+    loop = asyncio.get_running_loop()
+
     while True:
         try:
-            task = input("Enter task: ").strip()
-            
+            # input() blocks; run it on the executor so the event loop keeps
+            # servicing queries (e.g. progress polling) while the user types.
+            task = (await loop.run_in_executor(None, input, "Enter task: ")).strip()
+
+
             if task.lower() in ['quit', 'q', 'exit']:
                 print("Goodbye!")
                 break
@@ -69,16 +80,37 @@ async def main():
             
             print(f"Processing... (Workflow ID: {workflow_id[:16]}...)")
             logger.info(f"Executing workflow: {workflow_id}")
-            
-            result = await client.execute_workflow(
+
+            handle = await client.start_workflow(
                 DockerMonitorWorkflow.run,
                 task,
                 id=workflow_id,
                 task_queue=DOCKER_MONITOR_TASK_QUEUE
             )
-            
-            print()
-            print(result)
+
+            # Poll the partial_results query while the workflow runs so each
+            # operation's result prints as soon as it completes, instead of
+            # waiting for the slowest one.
+            result_future = asyncio.ensure_future(handle.result())
+            shown = 0
+            while True:
+                finished = result_future.done()
+                try:
+                    partial = await handle.query(DockerMonitorWorkflow.partial_results)
+                    for entry in partial[shown:]:
+                        print()
+                        print(entry)
+                    shown = len(partial)
+                except Exception:
+                    pass
+                if finished:
+                    break
+                await asyncio.sleep(0.5)
+
+            result = await result_future
+            if shown == 0:
+                print()
+                print(result)
             print()
             
         except KeyboardInterrupt:
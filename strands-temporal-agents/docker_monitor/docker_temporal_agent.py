@@ -2,7 +2,10 @@
 
 import sys
 from pathlib import Path
+import asyncio
 import logging
+import re
+import time
 from datetime import timedelta
 from temporalio import activity, workflow
 from temporalio.common import RetryPolicy
@@ -10,18 +13,144 @@ from temporalio.exceptions import ApplicationError
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from config import SPECULATIVE_STATUS_PREFETCH
+
+# Hoisted out of the activity bodies: activities run these imports once at
+# module load instead of paying the sys.modules lookups on every call, and
+# the pass-through keeps the workflow sandbox from re-importing docker.
+with workflow.unsafe.imports_passed_through():
+    from docker_monitor.aio_docker_utils import AioDockerClientWrapper
+    from docker_monitor.docker_utils import DockerConnectionError, ContainerNotFoundError
+
 logger = logging.getLogger(__name__)
 
+# Shared async Docker client for all activities on this worker. Creating a
+# client opens a fresh unix-socket session, so do it once lazily and reuse
+# it across activity invocations.
+_docker_client = None
+_docker_client_lock = asyncio.Lock()
+
+# Recent orchestrator plans keyed by normalized task. The plan space is tiny
+# and user queries repeat, so a fresh cache entry skips the Bedrock call.
+_plan_cache = {}
+_PLAN_CACHE_TTL_SECONDS = 300
+_PLAN_CACHE_MAX_ENTRIES = 128
+
+
+def _normalize_task(task: str) -> str:
+    """Collapse whitespace and case so near-duplicate queries share a cache key."""
+    return re.sub(r'\s+', ' ', task.strip().lower())
+
+
+# Common phrasings that map straight onto the tiny plan grammar. Matching one
+# of these answers the planning call in microseconds instead of an LLM round
+# trip; anything unmatched still goes to Bedrock.
+_FAST_PLAN_PATTERNS = [
+    (re.compile(r'^(?:check\s+)?(?:container\s+)?status$'),
+     lambda m: "status"),
+    (re.compile(r'^show\s+(?:me\s+)?running\s+containers?$'),
+     lambda m: "status:running"),
+    (re.compile(r'^show\s+(?:me\s+)?(?:all\s+)?containers?$'),
+     lambda m: "status"),
+    (re.compile(r'^restart(?:\s+the)?\s+([\w.-]+?)(?:\s+container)?$'),
+     lambda m: f"restart:{m.group(1)}"),
+    (re.compile(r'^(?:show\s+(?:me\s+)?|get\s+)?logs?\s+(?:for|from|of)\s+([\w.-]+)$'),
+     lambda m: f"logs:{m.group(1)}"),
+    (re.compile(r'^show\s+(?:me\s+)?([\w.-]+)\s+logs?$'),
+     lambda m: f"logs:{m.group(1)}"),
+    (re.compile(r'^is\s+([\w.-]+)\s+healthy\??$'),
+     lambda m: f"health:{m.group(1)}"),
+    (re.compile(r'^check\s+([\w.-]+)\s+health$'),
+     lambda m: f"health:{m.group(1)}"),
+    (re.compile(r'^(?:check\s+)?health(?:\s+of\s+([\w.-]+))?$'),
+     lambda m: f"health:{m.group(1)}" if m.group(1) else "health"),
+]
+
+
+def _parse_fast(task: str) -> str:
+    """Parse trivially-phrased tasks into a plan directly, or return None."""
+    normalized = _normalize_task(task)
+    for pattern, build_plan in _FAST_PLAN_PATTERNS:
+        match = pattern.match(normalized)
+        if match:
+            return build_plan(match)
+    return None
+
+
+_ORCHESTRATOR_SYSTEM_PROMPT = """Analyze the user request and return a comma-separated list of Docker operations.
+
+Available operations:
+- status[:filter] - Get container status (optionally filtered by name or status)
+- health[:container] - Check health (specific container or all if omitted)
+- logs:container[:lines] - Get container logs (default 100 lines)
+- restart:container - Restart a container
+
+Examples:
+"check container status" -> "status"
+"show me nginx logs" -> "logs:nginx"
+"is redis healthy?" -> "health:redis"
+"restart postgres" -> "restart:postgres"
+"check nginx health and show logs" -> "health:nginx,logs:nginx"
+"show running containers" -> "status:running"
+
+Return ONLY the comma-separated operation list, no explanations."""
+
+# Circuit breaker for the planning call: after enough consecutive Bedrock
+# failures, skip the LLM entirely for a cool-down window instead of letting
+# every workflow burn the full activity timeout before falling back.
+_BEDROCK_FAILURE_THRESHOLD = 3
+_BEDROCK_COOLDOWN_SECONDS = 60
+_bedrock_state = {'fails': 0, 'opened_at': 0.0}
+
+# Built once per worker: Bedrock client setup does credential resolution and
+# HTTP session construction, which would otherwise run on every planning call.
+_orchestrator_agent = None
+
+
+def _get_orchestrator():
+    """Return the shared planning agent, building it on first use."""
+    global _orchestrator_agent
+    if _orchestrator_agent is None:
+        from strands import Agent
+        from strands.models import BedrockModel
+        from config import AWS_REGION, BEDROCK_MODEL_ID
+
+        _orchestrator_agent = Agent(
+            model=BedrockModel(
+                model_id=BEDROCK_MODEL_ID,
+                region_name=AWS_REGION
+            ),
+            system_prompt=_ORCHESTRATOR_SYSTEM_PROMPT
+        )
+    return _orchestrator_agent
+
+
+async def _get_docker_client():
+    """Return the shared AioDockerClientWrapper, creating it on first use."""
+    global _docker_client
+    if _docker_client is None:
+        async with _docker_client_lock:
+            if _docker_client is None:
+                _docker_client = AioDockerClientWrapper()
+    return _docker_client
+
+
+async def close_docker_client():
+    """Close the shared Docker client. Called when the worker shuts down."""
+    global _docker_client
+    async with _docker_client_lock:
+        if _docker_client is not None:
+            await _docker_client.close()
+            _docker_client = None
+
 
 @activity.defn
 async def get_container_status_activity(filter_by: str = None) -> str:
     """Get container status with optional filtering."""
-    from docker_monitor.docker_utils import DockerClientWrapper, DockerConnectionError
-    
     activity.logger.info(f"Getting container status, filter: {filter_by}")
-    
+
     try:
-        docker_client = DockerClientWrapper()
+        docker_client = await _get_docker_client()
         
         filters = None
         if filter_by:
@@ -30,8 +159,8 @@ async def get_container_status_activity(filter_by: str = None) -> str:
             else:
                 filters = {'name': filter_by}
         
-        containers = docker_client.get_containers(all=True, filters=filters)
-        
+        containers = await docker_client.get_containers(all=True, filters=filters)
+
         if not containers:
             return f"No containers found matching '{filter_by}'" if filter_by else "No containers found on this system"
         
@@ -54,36 +183,40 @@ async def get_container_status_activity(filter_by: str = None) -> str:
 @activity.defn
 async def check_container_health_activity(container_name: str = None) -> str:
     """Check health of specific container or all containers."""
-    from docker_monitor.docker_utils import DockerClientWrapper, DockerConnectionError, ContainerNotFoundError
-    
     activity.logger.info(f"Checking container health: {container_name or 'all'}")
-    
+
     try:
-        docker_client = DockerClientWrapper()
+        docker_client = await _get_docker_client()
         
         if container_name:
-            health = docker_client.check_container_health(container_name)
+            health = await docker_client.check_container_health(container_name)
             activity.logger.info(f"Health check complete for {container_name}: {'healthy' if health.is_healthy else 'unhealthy'}")
             return health.format_summary()
-        
-        containers = docker_client.get_containers(all=False)
+
+        containers = await docker_client.get_containers(all=False)
         if not containers:
             return "No running containers found"
         
         results = [f"Health check for {len(containers)} running container(s):\n"]
         healthy_count = 0
-        
-        for container in containers:
-            try:
-                health = docker_client.check_container_health(container.name)
+
+        # Sweep mode mainly wants verdicts: containers the cheap checks
+        # already deem unhealthy report their issues without usage numbers,
+        # skipping the dominant stats call (and its ~1 s sampling window).
+        health_results = await docker_client.check_many_health(
+            [container.name for container in containers],
+            include_stats=False
+        )
+        for container, health in zip(containers, health_results):
+            if isinstance(health, Exception):
+                results.append(f"✗ {container.name}: Error checking health - {str(health)}")
+                results.append("")
+            else:
                 results.append(health.format_summary())
                 results.append("")
                 if health.is_healthy:
                     healthy_count += 1
-            except Exception as e:
-                results.append(f"✗ {container.name}: Error checking health - {str(e)}")
-                results.append("")
-        
+
         results.append(f"Summary: {healthy_count}/{len(containers)} containers healthy")
         activity.logger.info(f"Health check complete: {healthy_count}/{len(containers)} healthy")
         return "\n".join(results)
@@ -102,13 +235,11 @@ async def check_container_health_activity(container_name: str = None) -> str:
 @activity.defn
 async def get_container_logs_activity(container_name: str, lines: int = 100) -> str:
     """Retrieve container logs."""
-    from docker_monitor.docker_utils import DockerClientWrapper, DockerConnectionError, ContainerNotFoundError
-    
     activity.logger.info(f"Getting logs for {container_name}, lines: {lines}")
-    
+
     try:
-        docker_client = DockerClientWrapper()
-        logs = docker_client.get_container_logs(container_name, lines=lines)
+        docker_client = await _get_docker_client()
+        logs = await docker_client.get_container_logs(container_name, lines=lines)
         
         if not logs:
             return f"No logs found for container '{container_name}'"
@@ -134,13 +265,11 @@ async def get_container_logs_activity(container_name: str, lines: int = 100) ->
 @activity.defn
 async def restart_container_activity(container_name: str) -> str:
     """Restart a container."""
-    from docker_monitor.docker_utils import DockerClientWrapper, DockerConnectionError, ContainerNotFoundError
-    
     activity.logger.info(f"Restarting container: {container_name}")
-    
+
     try:
-        docker_client = DockerClientWrapper()
-        success = docker_client.restart_container(container_name)
+        docker_client = await _get_docker_client()
+        success = await docker_client.restart_container(container_name)
         
         if success:
             activity.logger.info(f"Successfully restarted {container_name}")
@@ -163,38 +292,27 @@ async def restart_container_activity(container_name: str) -> str:
 @activity.defn
 async def ai_orchestrator_activity(task: str) -> str:
     """AI-powered task orchestration that analyzes queries and returns operation plans."""
-    from config import AWS_REGION, BEDROCK_MODEL_ID
-    
     activity.logger.info(f"AI orchestrator processing task: {task}")
-    
-    try:
-        from strands import Agent
-        from strands.models import BedrockModel
-        
-        agent = Agent(
-            model=BedrockModel(
-                model_id=BEDROCK_MODEL_ID,
-                region_name=AWS_REGION
-            ),
-            system_prompt="""Analyze the user request and return a comma-separated list of Docker operations.
 
-Available operations:
-- status[:filter] - Get container status (optionally filtered by name or status)
-- health[:container] - Check health (specific container or all if omitted)
-- logs:container[:lines] - Get container logs (default 100 lines)
-- restart:container - Restart a container
+    fast_plan = _parse_fast(task)
+    if fast_plan is not None:
+        activity.logger.info(f"AI orchestrator fast-path plan: {fast_plan}")
+        return fast_plan
 
-Examples:
-"check container status" -> "status"
-"show me nginx logs" -> "logs:nginx"
-"is redis healthy?" -> "health:redis"
-"restart postgres" -> "restart:postgres"
-"check nginx health and show logs" -> "health:nginx,logs:nginx"
-"show running containers" -> "status:running"
+    cache_key = _normalize_task(task)
+    cached = _plan_cache.get(cache_key)
+    if cached and time.monotonic() - cached[1] < _PLAN_CACHE_TTL_SECONDS:
+        activity.logger.info(f"AI orchestrator cache hit: {cached[0]}")
+        return cached[0]
+
+    if _bedrock_state['fails'] >= _BEDROCK_FAILURE_THRESHOLD and \
+            time.monotonic() - _bedrock_state['opened_at'] < _BEDROCK_COOLDOWN_SECONDS:
+        activity.logger.warning("Bedrock circuit open, falling back to 'status' plan")
+        return "status"
+
+    try:
+        agent = _get_orchestrator()
 
-Return ONLY the comma-separated operation list, no explanations."""
-        )
-        
         result = agent(task)
         plan = str(result.content if hasattr(result, 'content') else result).strip()
         
@@ -202,10 +320,18 @@ Return ONLY the comma-separated operation list, no explanations."""
             activity.logger.warning(f"AI returned invalid plan: {plan}")
             plan = "status"
         
+        _bedrock_state['fails'] = 0
+
+        if len(_plan_cache) >= _PLAN_CACHE_MAX_ENTRIES:
+            _plan_cache.pop(next(iter(_plan_cache)))
+        _plan_cache[cache_key] = (plan, time.monotonic())
+
         activity.logger.info(f"AI orchestrator generated plan: {plan}")
         return plan
         
     except Exception as e:
+        _bedrock_state['fails'] += 1
+        _bedrock_state['opened_at'] = time.monotonic()
         activity.logger.warning(f"AI orchestrator failed: {e}, falling back to 'status'")
         return "status"
 
@@ -213,18 +339,44 @@ Return ONLY the comma-separated operation list, no explanations."""
 @workflow.defn
 class DockerMonitorWorkflow:
     """Temporal workflow for Docker container monitoring with automatic retries."""
-    
+
+    def __init__(self) -> None:
+        self._results = []
+
+    @workflow.query
+    def partial_results(self) -> list:
+        """Results of operations completed so far, in completion order."""
+        return list(self._results)
+
     @workflow.run
     async def run(self, task: str) -> str:
         """Execute Docker monitoring workflow."""
         workflow.logger.info(f"Starting Docker monitor workflow for task: {task}")
-        
+
+        # Most plans open with a status check, so start one speculatively and
+        # let its latency hide behind the seconds-long planning call.
+        status_handle = None
+        if SPECULATIVE_STATUS_PREFETCH:
+            status_handle = workflow.start_activity(
+                get_container_status_activity,
+                None,
+                start_to_close_timeout=timedelta(seconds=10),
+                retry_policy=RetryPolicy(
+                    maximum_attempts=3,
+                    initial_interval=timedelta(seconds=1),
+                    maximum_interval=timedelta(seconds=5),
+                    backoff_coefficient=2.0
+                )
+            )
+
         plan = await workflow.execute_activity(
             ai_orchestrator_activity,
             task,
             start_to_close_timeout=timedelta(seconds=15),
+            # A retry of a 15 s LLM call rarely helps; the activity already
+            # falls back to a 'status' plan on failure.
             retry_policy=RetryPolicy(
-                maximum_attempts=2,
+                maximum_attempts=1,
                 initial_interval=timedelta(seconds=1),
                 maximum_interval=timedelta(seconds=1),
                 backoff_coefficient=1.0
@@ -233,16 +385,35 @@ class DockerMonitorWorkflow:
         
         workflow.logger.info(f"Execution plan: {plan}")
         
-        results = []
         operations = [op.strip() for op in plan.split(',') if op.strip()]
-        
-        for operation_spec in operations:
+
+        # Each operation is an independent activity, so dispatch them all at
+        # once and let the workers run them concurrently. Total wall-clock
+        # drops from the sum of activity latencies to roughly the slowest one.
+        awaitables = []
+        for op in operations:
+            if status_handle is not None and op == 'status':
+                awaitables.append(status_handle)
+                status_handle = None
+            else:
+                awaitables.append(self._execute_operation(op))
+        if status_handle is not None:
+            status_handle.cancel()
+
+        async def run_and_record(operation_spec, awaitable):
+            # Publish each result through the partial_results query as soon
+            # as its activity finishes, so clients can render progressively.
             try:
-                result = await self._execute_operation(operation_spec)
-                results.append(result)
+                result = await awaitable
             except Exception as e:
                 workflow.logger.error(f"Operation {operation_spec} failed: {e}")
-                results.append(f"Operation '{operation_spec}' failed: {str(e)}")
+                result = f"Operation '{operation_spec}' failed: {str(e)}"
+            self._results.append(result)
+            return result
+
+        results = await asyncio.gather(
+            *(run_and_record(op, aw) for op, aw in zip(operations, awaitables))
+        )
         
         final_result = "\n\n".join(results)
         workflow.logger.info("Workflow completed successfully")
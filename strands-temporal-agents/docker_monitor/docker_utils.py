@@ -1,12 +1,18 @@
 """Docker utilities for container health monitoring with consistent error handling."""
 
+import os
 import sys
 from pathlib import Path
 import logging
+import selectors
+import threading
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Dict, Optional, Any
 import docker
+import orjson
+from ciso8601 import parse_datetime
 from docker.errors import DockerException, NotFound, APIError
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -34,7 +40,35 @@ class ContainerNotFoundError(Exception):
         super().__init__(f"Container '{container_name}' not found")
 
 
-@dataclass
+# Prebuilt pieces for the format_summary hot paths, so dumping status for a
+# large fleet doesn't rebuild templates or bound methods per container.
+_CONTAINER_TMPL = (
+    "Container: {name} ({id})\n"
+    "  Status: {status}\n"
+    "  Image: {image}\n"
+    "  Uptime: {uptime}\n"
+    "  Ports: {ports}"
+)
+_PCT_FMT = "{:.1f}%".format
+
+# Key tuples for to_dict(): built once so serializing a fleet doesn't
+# re-hash the same string literals per object.
+_CONTAINER_KEYS = ('id', 'name', 'status', 'image', 'created', 'started', 'ports', 'labels',
+                   'health', 'uptime_text')
+_HEALTH_KEYS = ('container_name', 'is_healthy', 'status', 'health_check_status',
+                'cpu_percent', 'memory_percent', 'restart_count', 'last_restart', 'issues')
+_RESULT_KEYS = ('operation', 'success', 'data', 'error', 'timestamp')
+
+# Statuses Docker can report; frozenset gives O(1) membership instead of
+# rebuilding a list and scanning it on every ContainerInfo construction.
+_VALID_STATUSES = frozenset({
+    'running', 'stopped', 'restarting', 'paused', 'exited', 'created', 'removing', 'dead'
+})
+
+
+# slots=True drops the per-instance __dict__ and turns attribute access
+# into an array load — these objects are built once per container per tick.
+@dataclass(slots=True)
 class ContainerInfo:
     """Information about a Docker container."""
     id: str
@@ -45,26 +79,32 @@ class ContainerInfo:
     started: Optional[datetime] = None
     ports: Dict[str, List[str]] = field(default_factory=dict)
     labels: Dict[str, str] = field(default_factory=dict)
-    
+    health: Optional[str] = None
+    # Human-readable uptime from the list API's Status line ("2 hours"),
+    # for entries where StartedAt (inspect-only) isn't available.
+    uptime_text: Optional[str] = None
+
     def __post_init__(self):
         if not self.id:
             raise ValueError("Container ID cannot be empty")
         if not self.name:
             raise ValueError("Container name cannot be empty")
-        if self.status not in ['running', 'stopped', 'restarting', 'paused', 'exited', 'created', 'removing', 'dead']:
+        if self.status not in _VALID_STATUSES:
             logger.warning(f"Unexpected container status: {self.status}")
     
     def to_dict(self) -> dict:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'status': self.status,
-            'image': self.image,
-            'created': self.created.isoformat(),
-            'started': self.started.isoformat() if self.started else None,
-            'ports': self.ports,
-            'labels': self.labels
-        }
+        return dict(zip(_CONTAINER_KEYS, (
+            self.id,
+            self.name,
+            self.status,
+            self.image,
+            self.created.isoformat(),
+            self.started.isoformat() if self.started else None,
+            self.ports,
+            self.labels,
+            self.health,
+            self.uptime_text
+        )))
     
     def format_summary(self) -> str:
         uptime = ""
@@ -77,19 +117,22 @@ class ContainerInfo:
                 uptime = f"{int(hours)} hours"
             else:
                 uptime = f"{int(hours / 24)} days"
-        
+        elif self.uptime_text:
+            uptime = self.uptime_text
+
         port_str = ", ".join([f"{k}->{','.join(v)}" for k, v in self.ports.items()]) if self.ports else "none"
-        
-        return (
-            f"Container: {self.name} ({self.id})\n"
-            f"  Status: {self.status}\n"
-            f"  Image: {self.image}\n"
-            f"  Uptime: {uptime if uptime else 'not started'}\n"
-            f"  Ports: {port_str}"
+
+        return _CONTAINER_TMPL.format(
+            name=self.name,
+            id=self.id,
+            status=self.status,
+            image=self.image,
+            uptime=uptime if uptime else 'not started',
+            ports=port_str
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Health status of a Docker container."""
     container_name: str
@@ -111,17 +154,17 @@ class HealthStatus:
             logger.warning(f"Memory percent out of expected range: {self.memory_percent}")
     
     def to_dict(self) -> dict:
-        return {
-            'container_name': self.container_name,
-            'is_healthy': self.is_healthy,
-            'status': self.status,
-            'health_check_status': self.health_check_status,
-            'cpu_percent': self.cpu_percent,
-            'memory_percent': self.memory_percent,
-            'restart_count': self.restart_count,
-            'last_restart': self.last_restart.isoformat() if self.last_restart else None,
-            'issues': self.issues
-        }
+        return dict(zip(_HEALTH_KEYS, (
+            self.container_name,
+            self.is_healthy,
+            self.status,
+            self.health_check_status,
+            self.cpu_percent,
+            self.memory_percent,
+            self.restart_count,
+            self.last_restart.isoformat() if self.last_restart else None,
+            self.issues
+        )))
     
     def format_summary(self) -> str:
         health_icon = "✓" if self.is_healthy else "✗"
@@ -136,10 +179,10 @@ class HealthStatus:
             lines.append(f"  Health Check: {self.health_check_status}")
         
         if self.cpu_percent is not None:
-            lines.append(f"  CPU: {self.cpu_percent:.1f}%")
-        
+            lines.append("  CPU: " + _PCT_FMT(self.cpu_percent))
+
         if self.memory_percent is not None:
-            lines.append(f"  Memory: {self.memory_percent:.1f}%")
+            lines.append("  Memory: " + _PCT_FMT(self.memory_percent))
         
         if self.restart_count > 0:
             lines.append(f"  Restarts: {self.restart_count}")
@@ -150,7 +193,7 @@ class HealthStatus:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OperationResult:
     """Result of a Docker operation."""
     operation: str
@@ -164,13 +207,13 @@ class OperationResult:
             raise ValueError("Operation name cannot be empty")
     
     def to_dict(self) -> dict:
-        return {
-            'operation': self.operation,
-            'success': self.success,
-            'data': self.data,
-            'error': self.error,
-            'timestamp': self.timestamp.isoformat()
-        }
+        return dict(zip(_RESULT_KEYS, (
+            self.operation,
+            self.success,
+            self.data,
+            self.error,
+            self.timestamp.isoformat()
+        )))
     
     def format_summary(self) -> str:
         status = "Success" if self.success else "Failed"
@@ -180,41 +223,356 @@ class OperationResult:
         return result
 
 
+def list_entry_to_info(entry: dict) -> ContainerInfo:
+    """Convert a raw /containers/json list entry to ContainerInfo."""
+    container_id = entry.get('Id', '')[:12]
+    names = entry.get('Names') or []
+    name = names[0].lstrip('/') if names else container_id
+
+    # The list API reports Created as a Unix epoch int — cheaper than the
+    # ISO parse the inspect path needs, and unambiguously UTC.
+    created_ts = entry.get('Created')
+    created = datetime.fromtimestamp(created_ts, tz=timezone.utc) if created_ts else datetime.now(timezone.utc)
+
+    # The list endpoint reports health only as a suffix of the human-readable
+    # Status line, e.g. "Up 2 hours (healthy)".
+    status_line = entry.get('Status', '')
+    health = None
+    if '(healthy)' in status_line:
+        health = 'healthy'
+    elif '(unhealthy)' in status_line:
+        health = 'unhealthy'
+    elif '(health: starting)' in status_line:
+        health = 'starting'
+
+    # The same Status line carries the uptime for running containers
+    # ("Up 2 hours (healthy)" -> "2 hours"), which inspect-only StartedAt
+    # can't provide here.
+    uptime_text = None
+    if status_line.startswith('Up '):
+        uptime_text = status_line[3:].split(' (')[0]
+
+    ports = {}
+    for binding in entry.get('Ports') or []:
+        if binding.get('PublicPort'):
+            key = f"{binding['PrivatePort']}/{binding.get('Type', 'tcp')}"
+            ports.setdefault(key, []).append(f"{binding.get('IP', '')}:{binding['PublicPort']}")
+
+    return ContainerInfo(
+        id=container_id,
+        name=name,
+        status=entry.get('State', 'unknown'),
+        image=entry.get('Image', ''),
+        created=created,
+        started=None,  # StartedAt only comes back from inspect
+        ports=ports,
+        labels=entry.get('Labels') or {},
+        health=health,
+        uptime_text=uptime_text
+    )
+
+
 class DockerClientWrapper:
     """Wrapper around Docker SDK with consistent error handling and structured data types."""
     
     def __init__(self):
+        # Connecting (and pinging) is deferred to the first call that needs
+        # the daemon, so merely constructing the wrapper — e.g. at import
+        # time in validation scripts — costs no network round trip.
+        self._client = None
+        self._client_lock = threading.Lock()
+
+        # Latest stats sample per tracked container, fed by streaming stats
+        # responses so health checks don't pay dockerd's ~1 s sampling
+        # window. All streams are multiplexed on one selector thread (epoll
+        # on Linux) instead of one reader thread per container.
+        self._stats_cache = {}
+        self._stats_sel = selectors.DefaultSelector()
+        self._stats_streams = {}
+        self._stats_buffers = {}
+        self._stats_mux_thread = None
+        self._stats_lock = threading.RLock()
+        self._stats_stop = threading.Event()
+
+        # Short-lived cache of converted container listings: monitoring
+        # callers re-list every tick, and at fleet scale /containers/json
+        # alone dominates daemon load.
+        self._list_cache = {}
+        self._list_ttl = 10.0
+
+        # Previous cgroup CPU snapshot per container id, for delta math
+        # without dockerd's sampling window.
+        self._prev_cpu = {}
+        self._ncpu = os.cpu_count() or 1
+        self._mem_total = self._read_mem_total()
+
+        # (memory limit bytes, cpu count) per container, read once from
+        # HostConfig: limits don't change over a container's lifetime, so
+        # later checks can skip those fields of the stats payload.
+        self._limits_cache = {}
+
+        # Memoized Docker timestamps keyed by (container id, raw string):
+        # Created and StartedAt are immutable while a container runs, so
+        # each one only ever needs parsing once.
+        self._ts_cache = {}
+
+    @staticmethod
+    def _read_mem_total() -> int:
+        """Total host memory in bytes, mirroring Docker's limit for unlimited containers."""
         try:
-            self.client = docker.from_env(timeout=DOCKER_TIMEOUT)
-            self.client.ping()
-            logger.info("Successfully connected to Docker daemon")
-        except DockerException as e:
-            logger.error(f"Failed to connect to Docker daemon: {e}")
-            raise DockerConnectionError(
-                "Docker daemon is not accessible. Please ensure Docker is running."
-            ) from e
+            with open('/proc/meminfo') as f:
+                for line in f:
+                    if line.startswith('MemTotal:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        return 1
+
+    @property
+    def client(self):
+        """Docker client, connected and pinged lazily on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        # The default pool holds 10 connections; the
+                        # health-check fanout plus the background stats and
+                        # event streams need more to avoid serializing on
+                        # the socket.
+                        client = docker.from_env(timeout=DOCKER_TIMEOUT, max_pool_size=64)
+                        client.ping()
+                        logger.info("Successfully connected to Docker daemon")
+                    except DockerException as e:
+                        logger.error(f"Failed to connect to Docker daemon: {e}")
+                        raise DockerConnectionError(
+                            "Docker daemon is not accessible. Please ensure Docker is running."
+                        ) from e
+                    self._client = client
+                    self._start_event_listener()
+        return self._client
+
+    def close(self):
+        """Stop the stats stream mux and release the Docker client."""
+        self._stats_stop.set()
+        for name in list(self._stats_streams):
+            self._close_stats_stream(name)
+        if self._client is not None:
+            self._client.close()
+
+    # Actions that change what the caches hold. Filtering server-side
+    # matters: a container with a HEALTHCHECK emits exec_create/exec_start/
+    # exec_die on every probe, and each of those would otherwise reach the
+    # handler and invalidate the very caches this listener exists to keep.
+    _EVENT_ACTIONS = ['start', 'stop', 'die', 'destroy', 'restart',
+                      'pause', 'unpause', 'rename', 'health_status']
+
+    def _start_event_listener(self) -> None:
+        """React to daemon container events push-style instead of re-polling.
+
+        A daemon thread follows /events filtered to container start/stop/
+        die/health_status actions and invalidates the affected cache
+        entries, so state changes become visible on the next call without
+        waiting out the listing TTL or re-inspecting every tick.
+        """
+        def listen():
+            try:
+                for event in self.client.events(
+                    decode=True,
+                    filters={'type': 'container', 'event': self._EVENT_ACTIONS}
+                ):
+                    if self._stats_stop.is_set():
+                        break
+                    self._handle_event(event)
+            except DockerException as e:
+                logger.debug(f"Docker event stream ended: {e}")
+
+        threading.Thread(target=listen, name="docker-events", daemon=True).start()
+
+    def _handle_event(self, event: dict) -> None:
+        """Apply one container event to the listing, stats, and CPU caches."""
+        name = event.get('Actor', {}).get('Attributes', {}).get('name')
+        container_id = event.get('id', '')
+        action = event.get('Action', '')
+
+        with self._stats_lock:
+            if container_id:
+                self._prev_cpu.pop(container_id, None)
+
+            if action.startswith('health_status:') and name:
+                # The event already carries the new verdict, so patch any
+                # still-fresh listing in place instead of discarding it.
+                verdict = action.split(':', 1)[1].strip()
+                for _, containers in self._list_cache.values():
+                    for info in containers:
+                        if info.name == name:
+                            info.health = verdict
+            else:
+                if name:
+                    # Close the stream (its socket dies with the container)
+                    # and forget the limits: a container recreated under the
+                    # same name may carry new HostConfig values.
+                    self._close_stats_stream(name)
+                    self._limits_cache.pop(name, None)
+                self._list_cache.clear()
+
+    def _ensure_stats_stream(self, container_name: str) -> None:
+        """Register a streaming stats response for a container with the mux.
+
+        Opens /containers/{name}/stats?stream=1 and hands the response's
+        socket to the shared selector thread, which keeps the freshest
+        sample in _stats_cache. One thread serves every stream, so tracking
+        N containers costs N sockets but no extra stacks.
+        """
+        with self._stats_lock:
+            if container_name in self._stats_streams or self._stats_stop.is_set():
+                return
+            try:
+                api = self.client.api
+                resp = api._get(
+                    api._url(f"/containers/{container_name}/stats"),
+                    params={'stream': 1},
+                    stream=True
+                )
+                api._raise_for_status(resp)
+                fd = resp.raw.fileno()
+            except (DockerException, OSError) as e:
+                logger.debug(f"Could not open stats stream for {container_name}: {e}")
+                return
+
+            self._stats_streams[container_name] = (resp, fd)
+            self._stats_buffers[container_name] = bytearray()
+            self._stats_sel.register(fd, selectors.EVENT_READ, container_name)
+
+            if self._stats_mux_thread is None:
+                self._stats_mux_thread = threading.Thread(
+                    target=self._stats_mux_loop, name="docker-stats-mux", daemon=True
+                )
+                self._stats_mux_thread.start()
+
+    def _stats_mux_loop(self) -> None:
+        """Drain whichever stats streams are readable; epoll-backed on Linux.
+
+        One stream's failure must not take the mux down with it — this
+        thread serves every tracked container and is never restarted — so
+        anything a drain raises closes that stream and the loop carries on.
+        """
+        while not self._stats_stop.is_set():
+            for key, _ in self._stats_sel.select(timeout=1.0):
+                try:
+                    self._drain_stats_stream(key.data)
+                except Exception:
+                    logger.exception(f"Stats stream for {key.data} failed, closing it")
+                    self._close_stats_stream(key.data)
+
+    def _drain_stats_stream(self, container_name: str) -> None:
+        """Read available bytes from one stream and keep its latest sample."""
+        with self._stats_lock:
+            entry = self._stats_streams.get(container_name)
+        if entry is None:
+            return
+        resp, _ = entry
+
+        try:
+            # read1 returns whatever decoded bytes are already available;
+            # read(amt) on a chunked response blocks until the full 64 KiB
+            # arrives, which at the ~1-2 KB/s a stats stream emits would pin
+            # the mux on one stream for tens of seconds and starve the rest.
+            # Leftover decoded data sits buffered until the next sample makes
+            # the fd readable again, so at worst a sample trails by one tick.
+            data = resp.raw.read1(65536)
+        except (OSError, ValueError):
+            data = b""
+        if not data:
+            self._close_stats_stream(container_name)
+            return
+
+        # Re-check under the lock: the events thread may have closed this
+        # stream (container die/stop) while read() was blocked above.
+        with self._stats_lock:
+            buf = self._stats_buffers.get(container_name)
+            if buf is None:
+                return
+            buf += data
+            while True:
+                newline = buf.find(b'\n')
+                if newline < 0:
+                    break
+                line = bytes(buf[:newline])
+                del buf[:newline + 1]
+                if line.strip():
+                    try:
+                        stats = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+                    self._stats_cache[container_name] = {
+                        key: stats[key] for key in self._STATS_KEYS if key in stats
+                    }
+
+    def _close_stats_stream(self, container_name: str) -> None:
+        """Unregister a stream from the mux and drop its cached sample."""
+        with self._stats_lock:
+            entry = self._stats_streams.pop(container_name, None)
+            self._stats_buffers.pop(container_name, None)
+            self._stats_cache.pop(container_name, None)
+            if entry is None:
+                return
+            resp, fd = entry
+            try:
+                self._stats_sel.unregister(fd)
+            except (KeyError, ValueError):
+                pass
+            resp.close()
     
     def get_containers(self, all: bool = True, filters: dict = None) -> List[ContainerInfo]:
         """Get list of containers with optional filtering."""
+        key = (all, tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in (filters or {}).items()
+        )))
+        cached = self._list_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._list_ttl:
+            return cached[1]
+
         try:
-            containers = self.client.containers.list(all=all, filters=filters)
-            return [self._container_to_info(c) for c in containers]
+            # Hit /containers/json directly: the high-level containers.list()
+            # re-inspects every container in the result, and size=False keeps
+            # Docker from walking each container's filesystem.
+            entries = self.client.api.containers(all=all, filters=filters, size=False)
+            containers = [list_entry_to_info(e) for e in entries]
+            self._list_cache[key] = (time.monotonic(), containers)
+            return containers
         except DockerException as e:
             logger.error(f"Failed to list containers: {e}")
             raise DockerConnectionError(
                 "Failed to retrieve container list from Docker daemon"
             ) from e
-    
+
+    def invalidate_containers(self) -> None:
+        """Drop cached container listings, e.g. after a mutating call."""
+        self._list_cache.clear()
+
+
+    def _parse_time_cached(self, container_id: str, value: str) -> Optional[datetime]:
+        """Parse a Docker RFC 3339 timestamp through the per-container memo.
+
+        ciso8601 handles the trailing Z directly, so no intermediate
+        .replace() strings are built; the zero value means unset.
+        """
+        if not value or value == '0001-01-01T00:00:00Z':
+            return None
+        key = (container_id, value)
+        parsed = self._ts_cache.get(key)
+        if parsed is None:
+            parsed = parse_datetime(value)
+            self._ts_cache[key] = parsed
+        return parsed
+
     def _container_to_info(self, container) -> ContainerInfo:
         """Convert Docker container object to ContainerInfo."""
-        created_str = container.attrs.get('Created', '')
-        created = datetime.fromisoformat(created_str.replace('Z', '+00:00')) if created_str else datetime.now()
-        
-        started = None
+        created = self._parse_time_cached(container.id, container.attrs.get('Created', '')) or datetime.now()
+
         state = container.attrs.get('State', {})
-        started_str = state.get('StartedAt', '')
-        if started_str and started_str != '0001-01-01T00:00:00Z':
-            started = datetime.fromisoformat(started_str.replace('Z', '+00:00'))
+        started = self._parse_time_cached(container.id, state.get('StartedAt', ''))
         
         ports = {}
         port_bindings = container.attrs.get('NetworkSettings', {}).get('Ports', {})
@@ -233,18 +591,27 @@ class DockerClientWrapper:
             labels=container.labels
         )
 
-    def get_container_logs(self, container_name: str, lines: int = 100, since: str = None) -> str:
-        """Retrieve logs from a container."""
+    def get_container_logs(self, container_name: str, lines: int = 100, since: str = None,
+                           *, return_bytes: bool = False):
+        """Retrieve logs from a container.
+
+        With return_bytes=True the raw blob is handed back undecoded, for
+        callers that only forward or scan it. Decoding uses errors='replace'
+        so a multi-byte character split at the tail boundary degrades to a
+        replacement character instead of raising.
+        """
         try:
-            container = self.client.containers.get(container_name)
-            
             log_kwargs = {'tail': lines, 'timestamps': True}
             if since:
                 log_kwargs['since'] = since
-            
-            logs = container.logs(**log_kwargs)
-            return logs.decode('utf-8') if logs else ""
-            
+
+            # /containers/{name}/logs accepts the name directly, so skip the
+            # inspect round trip that containers.get() would add.
+            logs = self.client.api.logs(container_name, **log_kwargs)
+            if return_bytes:
+                return logs or b""
+            return logs.decode('utf-8', errors='replace') if logs else ""
+
         except NotFound:
             logger.error(f"Container not found: {container_name}")
             raise ContainerNotFoundError(container_name)
@@ -254,18 +621,22 @@ class DockerClientWrapper:
                 f"Failed to retrieve logs from container '{container_name}'"
             ) from e
     
+    def get_container_log_blob(self, container_name: str, lines: int = 100) -> bytes:
+        """Retrieve logs from a container as raw bytes, skipping decode and split."""
+        return self.get_container_logs(container_name, lines=lines, return_bytes=True)
+
     def restart_container(self, container_name: str, timeout: int = 10) -> bool:
         """Restart a container."""
         try:
-            container = self.client.containers.get(container_name)
-            container.restart(timeout=timeout)
-            
-            container.reload()
-            if container.status == 'running':
+            self.client.api.restart(container_name, timeout=timeout)
+            self.invalidate_containers()
+
+            status = self.client.api.inspect_container(container_name).get('State', {}).get('Status')
+            if status == 'running':
                 logger.info(f"Successfully restarted container: {container_name}")
                 return True
-            
-            logger.warning(f"Container {container_name} restarted but status is: {container.status}")
+
+            logger.warning(f"Container {container_name} restarted but status is: {status}")
             return False
                 
         except NotFound:
@@ -277,22 +648,296 @@ class DockerClientWrapper:
                 f"Failed to restart container '{container_name}'"
             ) from e
 
-    def check_container_health(self, container_name: str) -> HealthStatus:
-        """Check comprehensive health status of a container including resource usage."""
+    def _cgroup_usage(self, container_id: str):
+        """Compute CPU/memory percent straight from the container's cgroup v2 files.
+
+        Returns (cpu_percent, memory_percent); cpu_percent is None on the
+        first sample since the delta needs a previous snapshot. Raises OSError
+        when the host doesn't expose the cgroup files, letting the caller fall
+        back to the stats API.
+        """
+        scope = Path(f"/sys/fs/cgroup/system.slice/docker-{container_id}.scope")
+
+        usage_usec = None
+        for line in (scope / "cpu.stat").read_text().splitlines():
+            if line.startswith("usage_usec "):
+                usage_usec = int(line.split()[1])
+                break
+
+        # Aggregate system time across all CPUs in usec (USER_HZ jiffies are 10 ms).
+        with open('/proc/stat') as f:
+            system_usec = sum(int(v) for v in f.readline().split()[1:]) * 10_000
+
+        cpu_percent = None
+        if usage_usec is not None:
+            prev = self._prev_cpu.get(container_id)
+            self._prev_cpu[container_id] = (usage_usec, system_usec)
+            if prev:
+                d_usage = usage_usec - prev[0]
+                d_system = system_usec - prev[1]
+                if d_system > 0:
+                    cpu_percent = (d_usage / d_system) * self._ncpu * 100.0
+
+        memory_current = int((scope / "memory.current").read_text())
+        limit_raw = (scope / "memory.max").read_text().strip()
+        memory_limit = self._mem_total if limit_raw == 'max' else int(limit_raw)
+        memory_percent = memory_current / memory_limit * 100.0 if memory_limit > 0 else None
+
+        return cpu_percent, memory_percent
+
+    # The only parts of the (large) stats payload the wrapper ever reads.
+    _STATS_KEYS = ('cpu_stats', 'precpu_stats', 'memory_stats')
+
+    def _stats_one_shot(self, container_name: str) -> dict:
+        """Fetch one stats sample via the raw endpoint, decoding with orjson.
+
+        The stats payload carries per-CPU, blkio, and network counters the
+        wrapper never looks at; decoding with orjson and slicing down to the
+        three used sections keeps the per-check JSON cost proportional to
+        what's actually consumed.
+        """
+        api = self.client.api
+        resp = api._get(
+            api._url(f"/containers/{container_name}/stats"),
+            params={'stream': 0, 'one-shot': 1}
+        )
+        api._raise_for_status(resp)
+        stats = orjson.loads(resp.content)
+        return {key: stats[key] for key in self._STATS_KEYS if key in stats}
+
+    def _container_limits(self, container_name: str, attrs: dict) -> tuple:
+        """Resolve (memory limit, cpu count) once per container from HostConfig.
+
+        Zero means unconstrained, in which case the host totals apply — the
+        same convention the stats endpoint uses for its limit fields.
+        """
+        limits = self._limits_cache.get(container_name)
+        if limits is None:
+            host_config = attrs.get('HostConfig', {})
+            memory_limit = host_config.get('Memory') or self._mem_total
+            nano_cpus = host_config.get('NanoCpus') or 0
+            cpu_count = nano_cpus / 1e9 if nano_cpus else self._ncpu
+            limits = (memory_limit, cpu_count)
+            self._limits_cache[container_name] = limits
+        return limits
+
+    @staticmethod
+    def _stats_percentages(stats: dict, limits: tuple = None):
+        """Derive CPU and memory percent from a stats API sample.
+
+        When cached (memory limit, cpu count) limits are supplied, the
+        corresponding stats fields aren't read at all. A one-shot sample has
+        no previous cycle: its precpu_stats comes back zeroed with
+        system_cpu_usage omitted, so no CPU delta can be formed and
+        cpu_percent stays None — but memory needs no delta and is computed
+        regardless.
+        """
+        cpu_percent = None
         try:
-            container = self.client.containers.get(container_name)
-            container.reload()
-            
+            cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
+                       stats['precpu_stats']['cpu_usage']['total_usage']
+            system_delta = stats['cpu_stats']['system_cpu_usage'] - \
+                          stats['precpu_stats']['system_cpu_usage']
+            cpu_count = limits[1] if limits else stats['cpu_stats'].get('online_cpus', 1)
+
+            if system_delta > 0:
+                cpu_percent = (cpu_delta / system_delta) * cpu_count * 100.0
+        except (KeyError, TypeError):
+            pass
+
+        memory_percent = None
+        try:
+            memory_usage = stats['memory_stats'].get('usage', 0)
+            memory_limit = limits[0] if limits else stats['memory_stats'].get('limit', 1)
+            memory_percent = (memory_usage / memory_limit) * 100.0
+        except (KeyError, TypeError, ZeroDivisionError):
+            pass
+
+        return cpu_percent, memory_percent
+
+    def _cached_info(self, container_name: str) -> Optional[ContainerInfo]:
+        """Find a container in any still-fresh cached listing."""
+        now = time.monotonic()
+        for ts, containers in self._list_cache.values():
+            if now - ts < self._list_ttl:
+                for info in containers:
+                    if info.name == container_name:
+                        return info
+        return None
+
+    def check_container_health_from_info(self, info: ContainerInfo,
+                                         include_stats: bool = True) -> HealthStatus:
+        """Build a HealthStatus from list-API data without an inspect call.
+
+        Status and the health-check verdict come straight from the cached
+        listing; resource usage comes from the stats stream cache, falling
+        back to a one-shot stats sample on the first check of a container.
+        The list API doesn't report RestartCount, so the restart-count
+        threshold only applies on the inspect path in check_container_health
+        and restart_count/last_restart stay at their defaults here.
+        """
+        issues = []
+        is_healthy = True
+
+        if info.status != 'running':
+            is_healthy = False
+            issues.append(f"Container is {info.status}, not running")
+
+        if info.health == 'unhealthy':
+            is_healthy = False
+            issues.append("Docker health check reports unhealthy")
+
+        cpu_percent = None
+        memory_percent = None
+        if info.status == 'running' and (include_stats or is_healthy):
+            stats = self._stats_cache.get(info.name)
+            if stats is None:
+                # Register the stream so later checks hit the cache, but
+                # don't return empty numbers now — a one-shot sample lets
+                # the thresholds fire on the very first check too.
+                self._ensure_stats_stream(info.name)
+                try:
+                    stats = self._stats_one_shot(info.name)
+                except DockerException as e:
+                    logger.debug(f"Could not fetch stats for {info.name}: {e}")
+            if stats is not None:
+                cpu_percent, memory_percent = self._stats_percentages(
+                    stats, self._limits_cache.get(info.name)
+                )
+
+        if cpu_percent is not None and cpu_percent > CPU_THRESHOLD_PERCENT:
+            is_healthy = False
+            issues.append(f"High CPU usage: {cpu_percent:.1f}%")
+
+        if memory_percent is not None and memory_percent > MEMORY_THRESHOLD_PERCENT:
+            is_healthy = False
+            issues.append(f"High memory usage: {memory_percent:.1f}%")
+
+        return HealthStatus(
+            container_name=info.name,
+            is_healthy=is_healthy,
+            status=info.status,
+            health_check_status=info.health,
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            issues=issues
+        )
+
+    def check_many_health_vectorized(self, container_names: List[str]) -> List[HealthStatus]:
+        """Check many containers with the threshold arithmetic vectorized.
+
+        Gathers one stats sample per container into structure-of-arrays
+        columns, then computes the CPU/memory percentages and threshold
+        masks as single NumPy array passes instead of per-container Python
+        arithmetic. Worth it at fleet scale; check_container_health remains
+        the single-container path.
+        """
+        import numpy as np  # deferred: only this batch path needs it
+
+        # One listing warms the cache so status/health come without inspects.
+        self.get_containers(all=True)
+
+        n = len(container_names)
+        cpu_delta = np.zeros(n, dtype=np.float64)
+        system_delta = np.zeros(n, dtype=np.float64)
+        cpu_count = np.zeros(n, dtype=np.float64)
+        mem_usage = np.zeros(n, dtype=np.float64)
+        mem_limit = np.zeros(n, dtype=np.float64)
+
+        infos = []
+        for i, name in enumerate(container_names):
+            infos.append(self._cached_info(name))
+            stats = self._stats_cache.get(name)
+            if stats is None:
+                self._ensure_stats_stream(name)
+                try:
+                    stats = self._stats_one_shot(name)
+                except DockerException as e:
+                    logger.debug(f"Could not fetch stats for {name}: {e}")
+                    continue
+            try:
+                cpu_delta[i] = stats['cpu_stats']['cpu_usage']['total_usage'] - \
+                               stats['precpu_stats']['cpu_usage']['total_usage']
+                system_delta[i] = stats['cpu_stats']['system_cpu_usage'] - \
+                                  stats['precpu_stats']['system_cpu_usage']
+                cpu_count[i] = stats['cpu_stats'].get('online_cpus', 1)
+                mem_usage[i] = stats['memory_stats'].get('usage', 0)
+                mem_limit[i] = stats['memory_stats'].get('limit', 0)
+            except (KeyError, TypeError):
+                system_delta[i] = 0.0
+                mem_limit[i] = 0.0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cpu = np.where(system_delta > 0, cpu_delta / system_delta * cpu_count * 100.0, np.nan)
+            mem = np.where(mem_limit > 0, mem_usage / mem_limit * 100.0, np.nan)
+        cpu_hot = cpu > CPU_THRESHOLD_PERCENT
+        mem_hot = mem > MEMORY_THRESHOLD_PERCENT
+
+        results = []
+        for i, name in enumerate(container_names):
+            info = infos[i]
+            status = info.status if info else 'unknown'
+            health = info.health if info else None
+
             issues = []
             is_healthy = True
-            
-            status = container.status
             if status != 'running':
                 is_healthy = False
                 issues.append(f"Container is {status}, not running")
-            
+            if health == 'unhealthy':
+                is_healthy = False
+                issues.append("Docker health check reports unhealthy")
+
+            cpu_percent = None if np.isnan(cpu[i]) else float(cpu[i])
+            memory_percent = None if np.isnan(mem[i]) else float(mem[i])
+            if cpu_hot[i]:
+                is_healthy = False
+                issues.append(f"High CPU usage: {cpu_percent:.1f}%")
+            if mem_hot[i]:
+                is_healthy = False
+                issues.append(f"High memory usage: {memory_percent:.1f}%")
+
+            results.append(HealthStatus(
+                container_name=name,
+                is_healthy=is_healthy,
+                status=status,
+                health_check_status=health,
+                cpu_percent=cpu_percent,
+                memory_percent=memory_percent,
+                issues=issues
+            ))
+        return results
+
+    def check_container_health(self, container_name: str,
+                               include_stats: bool = True) -> HealthStatus:
+        """Check comprehensive health status of a container including resource usage.
+
+        With include_stats=False, callers that only need the verdict let the
+        check short-circuit: once the cheap predicates (status, health check,
+        restart count) have already decided unhealthy, the expensive stats
+        round trip is skipped and the percentages stay None.
+        """
+        # A fresh listing already carries status plus the health-check
+        # verdict, so reuse it and skip the per-container inspect round trip.
+        info = self._cached_info(container_name)
+        if info is not None:
+            return self.check_container_health_from_info(info, include_stats)
+
+        try:
+            # One inspect by name replaces containers.get() + reload(),
+            # which each issued their own inspect call.
+            attrs = self.client.api.inspect_container(container_name)
+
+            issues = []
+            is_healthy = True
+
+            state = attrs.get('State', {})
+            status = state.get('Status', 'unknown')
+            if status != 'running':
+                is_healthy = False
+                issues.append(f"Container is {status}, not running")
+
             health_check_status = None
-            state = container.attrs.get('State', {})
             health = state.get('Health', {})
             if health:
                 health_check_status = health.get('Status', 'none')
@@ -305,40 +950,44 @@ class DockerClientWrapper:
                 is_healthy = False
                 issues.append(f"High restart count: {restart_count}")
             
-            last_restart = None
-            started_str = state.get('StartedAt', '')
-            if started_str and started_str != '0001-01-01T00:00:00Z':
-                last_restart = datetime.fromisoformat(started_str.replace('Z', '+00:00'))
+            last_restart = self._parse_time_cached(attrs.get('Id', ''), state.get('StartedAt', ''))
             
             cpu_percent = None
             memory_percent = None
-            try:
-                stats = container.stats(stream=False)
-                
-                cpu_delta = stats['cpu_stats']['cpu_usage']['total_usage'] - \
-                           stats['precpu_stats']['cpu_usage']['total_usage']
-                system_delta = stats['cpu_stats']['system_cpu_usage'] - \
-                              stats['precpu_stats']['system_cpu_usage']
-                cpu_count = stats['cpu_stats'].get('online_cpus', 1)
-                
-                if system_delta > 0:
-                    cpu_percent = (cpu_delta / system_delta) * cpu_count * 100.0
-                    if cpu_percent > CPU_THRESHOLD_PERCENT:
-                        is_healthy = False
-                        issues.append(f"High CPU usage: {cpu_percent:.1f}%")
-                
-                memory_usage = stats['memory_stats'].get('usage', 0)
-                memory_limit = stats['memory_stats'].get('limit', 1)
-                memory_percent = (memory_usage / memory_limit) * 100.0
-                if memory_percent > MEMORY_THRESHOLD_PERCENT:
-                    is_healthy = False
-                    issues.append(f"High memory usage: {memory_percent:.1f}%")
-                    
-            except (KeyError, ZeroDivisionError) as e:
-                logger.debug(f"Could not calculate resource usage for {container_name}: {e}")
-            
+            # Stopped containers have no usage to report, but dockerd still
+            # pays the stats round trip (and its sampling window) if asked —
+            # only collect for running containers, and only when the caller
+            # wants numbers or the cheap checks haven't already decided.
+            if status == 'running' and (include_stats or is_healthy):
+                try:
+                    # Cheapest path: read the cgroup counters directly and compute
+                    # the deltas ourselves, skipping the stats HTTP call entirely.
+                    cpu_percent, memory_percent = self._cgroup_usage(attrs.get('Id', ''))
+                except (OSError, ValueError, IndexError):
+                    # No cgroup v2 files on this host (e.g. Docker Desktop):
+                    # fall back to the stats API via the background stream cache.
+                    try:
+                        stats = self._stats_cache.get(container_name)
+                        if stats is None:
+                            self._ensure_stats_stream(container_name)
+                            stats = self._stats_one_shot(container_name)
+                        cpu_percent, memory_percent = self._stats_percentages(
+                            stats, self._container_limits(container_name, attrs)
+                        )
+                    except DockerException as e:
+                        logger.debug(f"Could not calculate resource usage for {container_name}: {e}")
+
+            if cpu_percent is not None and cpu_percent > CPU_THRESHOLD_PERCENT:
+                is_healthy = False
+                issues.append(f"High CPU usage: {cpu_percent:.1f}%")
+
+            if memory_percent is not None and memory_percent > MEMORY_THRESHOLD_PERCENT:
+                is_healthy = False
+                issues.append(f"High memory usage: {memory_percent:.1f}%")
+
+
             return HealthStatus(
-                container_name=container.name,
+                container_name=attrs.get('Name', container_name).lstrip('/'),
                 is_healthy=is_healthy,
                 status=status,
                 health_check_status=health_check_status,
@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import TEMPORAL_HOST, DOCKER_MONITOR_TASK_QUEUE
 from docker_monitor.docker_temporal_agent import (
     DockerMonitorWorkflow,
+    close_docker_client,
     get_container_status_activity,
     check_container_health_activity,
     get_container_logs_activity,
@@ -66,8 +67,11 @@ async def main():
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 60)
         
-        await worker.run()
-        
+        try:
+            await worker.run()
+        finally:
+            await close_docker_client()
+
     except KeyboardInterrupt:
         logger.info("\nShutting down worker...")
     except Exception as e:
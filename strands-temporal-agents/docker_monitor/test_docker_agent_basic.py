@@ -65,6 +65,50 @@ def test_data_models():
         traceback.print_exc()
         return False
 
+def test_pure_helpers():
+    print("\nTesting pure helpers...")
+    try:
+        from docker_utils import list_entry_to_info
+        entry = {
+            'Id': 'a' * 64,
+            'Names': ['/web'],
+            'State': 'running',
+            'Image': 'nginx:latest',
+            'Created': 1756700000,
+            'Status': 'Up 2 hours (healthy)',
+            'Ports': [{'PrivatePort': 80, 'PublicPort': 8080, 'Type': 'tcp', 'IP': '0.0.0.0'}],
+            'Labels': {'app': 'web'},
+        }
+        info = list_entry_to_info(entry)
+        assert info.id == 'a' * 12
+        assert info.name == 'web'
+        assert info.health == 'healthy'
+        assert info.uptime_text == '2 hours'
+        assert info.ports == {'80/tcp': ['0.0.0.0:8080']}
+        assert list_entry_to_info({**entry, 'Status': 'Exited (0) 3 days ago',
+                                  'State': 'exited'}).uptime_text is None
+        print("✓ list_entry_to_info works")
+
+        from docker_agent import _scan_log_levels
+        counts, errors = _scan_log_levels(b"ERROR boom: ERROR twice\nINFO ok\nwarn low disk\n")
+        assert counts == {'INFO': 1, 'WARN': 1, 'ERROR': 1, 'DEBUG': 0}
+        assert errors == ["ERROR boom: ERROR twice"]
+        print("✓ _scan_log_levels counts per line")
+
+        from docker_temporal_agent import _parse_fast
+        assert _parse_fast("restart nginx") == "restart:nginx"
+        assert _parse_fast("is redis healthy?") == "health:redis"
+        assert _parse_fast("Show me running containers") == "status:running"
+        assert _parse_fast("do a backflip") is None
+        print("✓ _parse_fast grammar works")
+
+        return True
+    except Exception as e:
+        print(f"✗ Pure helper test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def test_agent_structure():
     print("\nTesting agent structure...")
     try:
@@ -97,6 +141,7 @@ def main():
     
     results.append(("Imports", test_imports()))
     results.append(("Data Models", test_data_models()))
+    results.append(("Pure Helpers", test_pure_helpers()))
     results.append(("Agent Structure", test_agent_structure()))
     
     print("\n" + "=" * 60)
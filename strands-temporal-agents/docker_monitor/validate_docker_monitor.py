@@ -1,5 +1,5 @@
+import compileall
 import sys
-import subprocess
 
 def print_header(text):
     print("\n" + "=" * 60)
@@ -23,24 +23,20 @@ def test_compilation():
         'docker_client.py'
     ]
     
+    # Compile in-process instead of spawning one interpreter per file:
+    # startup cost dominated the old subprocess loop.
     all_passed = True
     for file in files:
         try:
-            result = subprocess.run(
-                ['python', '-m', 'py_compile', file],
-                capture_output=True,
-                text=True
-            )
-            passed = result.returncode == 0
+            passed = bool(compileall.compile_file(file, quiet=1))
             print_result(f"  {file}", passed)
             if not passed:
-                print(f"    Error: {result.stderr}")
                 all_passed = False
         except Exception as e:
             print_result(f"  {file}", False)
             print(f"    Error: {e}")
             all_passed = False
-    
+
     return all_passed
 
 def test_imports():
@@ -1,8 +1,17 @@
 import os
+import readline  # noqa: F401 - line editing and history for input()
+import sys
 from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
 from strands import Agent, tool
 from strands.models import BedrockModel
-from config import AWS_REGION, BEDROCK_MODEL_ID, WEATHER_TIMEOUT
+from config import AWS_REGION, BEDROCK_MODEL_ID, BEDROCK_PROMPT_CACHE, WEATHER_TIMEOUT
+
+# One session for all weather calls: keep-alive reuses the TCP+TLS
+# connection to wttr.in instead of re-handshaking per call.
+_HTTP = requests.Session()
+_HTTP.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0))
 
 
 @tool
@@ -10,11 +19,22 @@ def get_time() -> str:
     return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
 
+def _list_py_files(limit: int = 5) -> list:
+    """First few .py entries via scandir, stopping as soon as enough are found."""
+    found = []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.endswith('.py'):
+                found.append(entry.name)
+                if len(found) >= limit:
+                    break
+    return found
+
+
 @tool
 def list_files() -> str:
     try:
-        files = [f for f in os.listdir('.') if f.endswith('.py')]
-        return f"Python files: {', '.join(files[:5])}"
+        return f"Python files: {', '.join(_list_py_files())}"
     except Exception as e:
         return f"File listing error: {str(e)}"
 
@@ -22,12 +42,13 @@ def list_files() -> str:
 @tool
 def get_weather(city: str) -> str:
     try:
-        import requests
-        
         url = f"https://wttr.in/{city}?format=%C+%t"
-        response = requests.get(url, timeout=WEATHER_TIMEOUT)
+        response = _HTTP.get(url, timeout=WEATHER_TIMEOUT)
         
         if response.status_code == 200:
+            # wttr.in is always UTF-8; declaring it skips requests'
+            # charset-detection pass over the body.
+            response.encoding = 'utf-8'
             weather_data = response.text.strip()
             return f"{city}: {weather_data}"
         
@@ -41,7 +62,11 @@ def create_agent() -> Agent:
     return Agent(
         model=BedrockModel(
             model_id=BEDROCK_MODEL_ID,
-            region_name=AWS_REGION
+            region_name=AWS_REGION,
+            # Checkpoint the static system prompt and tool schemas so
+            # Bedrock reuses the precomputed prefix across turns.
+            **({'cache_prompt': 'default', 'cache_tools': 'default'}
+               if BEDROCK_PROMPT_CACHE else {})
         ),
         tools=[get_time, list_files, get_weather],
         system_prompt="Use available tools to provide accurate, helpful responses."
@@ -49,34 +74,35 @@ def create_agent() -> Agent:
 
 
 def main():
-    print("Simple Agent Demo")
-    print("Type 'quit' to exit")
-    print()
-    
+    # One write + flush per turn instead of a syscall per print.
+    sys.stdout.write("Simple Agent Demo\nType 'quit' to exit\n\n")
+    sys.stdout.flush()
+
     agent = create_agent()
-    
+
     while True:
         try:
             task = input("Enter task: ").strip()
-            
+
             if task.lower() in ['quit', 'q', 'exit']:
                 print("Goodbye!")
                 break
-            
+
             if not task:
                 continue
-            
-            print("Processing...")
+
+            sys.stdout.write("Processing...\n")
+            sys.stdout.flush()
             result = agent(task)
-            print(f"Result: {result}")
-            print()
-            
+            sys.stdout.write(f"Result: {result}\n\n")
+            sys.stdout.flush()
+
         except KeyboardInterrupt:
             print("\nGoodbye!")
             break
         except Exception as e:
-            print(f"Error: {e}")
-            print()
+            sys.stdout.write(f"Error: {e}\n\n")
+            sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ import logging
 from datetime import datetime
 from temporalio.client import Client
 from config import TEMPORAL_HOST, TASK_QUEUE
+from serialization import ORJSON_DATA_CONVERTER
 from temporal_agent import TemporalAgentWorkflow
 
 logging.basicConfig(level=logging.INFO)
@@ -20,7 +21,7 @@ async def main():
     print("Type 'quit' to exit\n")
     
     try:
-        client = await Client.connect(TEMPORAL_HOST)
+        client = await Client.connect(TEMPORAL_HOST, data_converter=ORJSON_DATA_CONVERTER)
     except Exception as e:
         print(f"Failed to connect to Temporal: {e}")
         return
@@ -0,0 +1,55 @@
+"""orjson-backed Temporal payload serialization.
+
+Activity args and results cross the wire as json/plain payloads; swapping
+the stdlib encoder for orjson's C implementation cuts the per-payload
+serialization cost without changing the wire format, so histories stay
+readable in the Temporal UI and compatible with other SDKs.
+"""
+import orjson
+from temporalio.api.common.v1 import Payload
+from temporalio.converter import (
+    CompositePayloadConverter,
+    DataConverter,
+    DefaultPayloadConverter,
+    JSONPlainPayloadConverter,
+    value_to_type,
+)
+
+
+class OrjsonPayloadConverter(JSONPlainPayloadConverter):
+    """json/plain converter that encodes and decodes with orjson."""
+
+    def to_payload(self, value):
+        try:
+            data = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except (TypeError, orjson.JSONEncodeError):
+            # orjson rejects some values the stock encoder supports (e.g.
+            # classes exposing a dict() method); fall back for those.
+            return super().to_payload(value)
+        return Payload(metadata={"encoding": self.encoding.encode()}, data=data)
+
+    def from_payload(self, payload, type_hint=None):
+        try:
+            obj = orjson.loads(payload.data)
+        except orjson.JSONDecodeError as err:
+            raise RuntimeError("Failed parsing") from err
+        if type_hint:
+            obj = value_to_type(type_hint, obj, self._custom_type_converters)
+        return obj
+
+
+class OrjsonCompositeConverter(CompositePayloadConverter):
+    """Default converter chain with the json/plain step swapped for orjson."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            *(
+                OrjsonPayloadConverter()
+                if isinstance(converter, JSONPlainPayloadConverter)
+                else converter
+                for converter in DefaultPayloadConverter.default_encoding_payload_converters
+            )
+        )
+
+
+ORJSON_DATA_CONVERTER = DataConverter(payload_converter_class=OrjsonCompositeConverter)
@@ -1,94 +1,280 @@
+import asyncio
+import functools
 import os
 import logging
+import re
+import time
 from datetime import datetime, timedelta
+import aiohttp
 from temporalio import activity, workflow
 from temporalio.common import RetryPolicy
-from config import AWS_REGION, BEDROCK_MODEL_ID
+from config import AWS_REGION, BEDROCK_MODEL_ID, BEDROCK_PROMPT_CACHE
 
 logger = logging.getLogger(__name__)
 
+# Shared aiohttp session (created lazily on the worker's event loop) so
+# weather calls reuse one connection pool and never block the loop the way
+# a synchronous HTTP client would.
+_http_session = None
+
+
+async def _get_http_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+        )
+    return _http_session
+
+_FACT_SYSTEM_PROMPT = "Provide interesting, accurate facts about the requested topic. Be concise."
+
+_ORCHESTRATOR_SYSTEM_PROMPT = """Analyze the user request and return a comma-separated list of activities.
+
+Available: time, weather:city, files, fact:topic
+
+Examples:
+"what time is it" -> "time"
+"weather in tokyo" -> "time,weather:tokyo"
+"show files and weather in london" -> "time,files,weather:london"
+
+Always include 'time' first. Extract cities/topics accurately."""
+
+_MISSING = object()
+
+
+def _text(result) -> str:
+    """Extract the text of an agent result, content attribute or not.
+
+    getattr with a sentinel is one C-level lookup; the old hasattr idiom
+    set up exception machinery on every call.
+    """
+    content = getattr(result, 'content', _MISSING)
+    return str(result if content is _MISSING else content)
+
+
+# One pass over the plan string: yields (name, param) pairs while absorbing
+# the whitespace the model sometimes adds around commas and colons.
+_PLAN_RE = re.compile(r'([a-z_]+)(?::([^,]+))?')
+
+# Unambiguous phrasings whose plans can be built without the model. Each
+# pattern must match the whole (normalized) task, so anything with extra
+# context still goes to Bedrock.
+_FAST_PLAN_PATTERNS = (
+    (re.compile(r"^(?:what(?:'s| is)?\s+(?:the\s+)?)?time(?:\s+is\s+it)?\??$"),
+     lambda m: "time"),
+    (re.compile(r"^(?:show|list)\s+(?:the\s+)?(?:my\s+)?files\??$"),
+     lambda m: "time,files"),
+    (re.compile(r"^(?:what(?:'s| is)?\s+(?:the\s+)?)?weather\s+(?:in|for|at)\s+([\w\s-]+?)\??$"),
+     lambda m: f"time,weather:{m.group(1).strip()}"),
+    (re.compile(r"^(?:tell\s+me\s+)?(?:an?\s+)?(?:interesting\s+)?fact\s+about\s+([\w\s-]+?)\??$"),
+     lambda m: f"time,fact:{m.group(1).strip()}"),
+)
+
+
+def _fast_plan(normalized_task: str):
+    """Return a locally built plan for trivially classified tasks, else None."""
+    for pattern, build in _FAST_PLAN_PATTERNS:
+        match = pattern.match(normalized_task)
+        if match:
+            return build(match)
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _get_agent(system_prompt: str):
+    """Build an Agent once per system prompt and reuse it across activity calls.
+
+    Constructing BedrockModel resolves credentials and opens a TLS
+    connection; caching keeps that (and the boto3 connection pool) alive
+    for the worker's lifetime instead of paying it per invocation. Imports
+    stay inside so the workflow sandbox never loads strands.
+    """
+    from strands import Agent
+    from strands.models import BedrockModel
+    from botocore.config import Config
+
+    return Agent(
+        model=BedrockModel(
+            model_id=BEDROCK_MODEL_ID,
+            region_name=AWS_REGION,
+            # Temporal owns retries at the activity level.
+            boto_client_config=Config(retries={'max_attempts': 1}, max_pool_connections=20),
+            **({'cache_prompt': 'default'} if BEDROCK_PROMPT_CACHE else {})
+        ),
+        system_prompt=system_prompt
+    )
+
+
+# The formatted time only changes once per second, so concurrent callers
+# within the same second share one strftime result.
+_last_time = (0, "")
+
 
 @activity.defn
 async def get_time_activity() -> str:
-    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    global _last_time
+    second = int(time.time())
+    if second != _last_time[0]:
+        _last_time = (second, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+    return _last_time[1]
 
 
 @activity.defn
 async def get_weather_activity(city: str) -> str:
-    import requests
-    
+    session = await _get_http_session()
     try:
-        response = requests.get(f"https://wttr.in/{city}?format=%C+%t", timeout=10)
-        if response.status_code == 200:
-            return f"{city}: {response.text.strip()}"
-        return f"Weather unavailable for {city}"
-    except requests.RequestException:
-        # Let Temporal handle retries
+        async with session.get(
+            f"https://wttr.in/{city}?format=%C+%t",
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status == 200:
+                # wttr.in is always UTF-8; being explicit skips aiohttp's
+                # charset detection.
+                text = await response.text(encoding='utf-8')
+                return f"{city}: {text.strip()}"
+            return f"Weather unavailable for {city}"
+    except aiohttp.ClientError:
+        # Raise so the plan executor's per-step retry can take another run.
         raise
 
 
+def _list_py_files(limit: int = 5) -> list:
+    """First few .py entries via scandir, stopping as soon as enough are found."""
+    found = []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.endswith('.py'):
+                found.append(entry.name)
+                if len(found) >= limit:
+                    break
+    return found
+
+
 @activity.defn
 async def list_files_activity() -> str:
-    files = [f for f in os.listdir('.') if f.endswith('.py')]
-    return f"Files: {', '.join(files[:5])}"
+    return f"Files: {', '.join(_list_py_files())}"
+
+
+def warm_up() -> None:
+    """Pay the cold-start tax at worker boot instead of on the first request.
+
+    Importing strands/boto3 and constructing the Bedrock clients costs
+    hundreds of milliseconds the first time; building both cached agents
+    here means no production activity absorbs that spike. Failures (e.g.
+    missing AWS credentials) are logged and deferred to the first call.
+    """
+    try:
+        _get_agent(_ORCHESTRATOR_SYSTEM_PROMPT)
+        _get_agent(_FACT_SYSTEM_PROMPT)
+    except Exception as e:
+        logger.warning(f"Agent warm-up failed, deferring to first call: {e}")
 
 
 @activity.defn
 async def get_fact_activity(topic: str) -> str:
-    from strands import Agent
-    from strands.models import BedrockModel
-    
-    agent = Agent(
-        model=BedrockModel(
-            model_id=BEDROCK_MODEL_ID,
-            region_name=AWS_REGION
-        ),
-        system_prompt="Provide interesting, accurate facts about the requested topic. Be concise."
-    )
-    
-    result = agent(f"Tell me an interesting fact about {topic}")
-    return str(result.content if hasattr(result, 'content') else result)
+    agent = _get_agent(_FACT_SYSTEM_PROMPT)
+    # agent() is a synchronous Bedrock call; run it on a thread so it
+    # doesn't block the event loop and serialize the plan's other steps.
+    result = await asyncio.to_thread(agent, f"Tell me an interesting fact about {topic}")
+    return _text(result)
+
+
+@functools.lru_cache(maxsize=1024)
+def _plan_for(normalized_task: str) -> str:
+    """Ask the orchestrator model for a plan; repeat tasks hit the cache.
+
+    Plans are tiny deterministic strings, so an exact-match LRU on the
+    normalized task wipes out the Bedrock round trip — the dominant
+    workflow cost — whenever a task repeats. Failures raise before
+    anything is cached.
+    """
+    agent = _get_agent(_ORCHESTRATOR_SYSTEM_PROMPT)
+    result = agent(normalized_task)
+    return _text(result).strip()
 
 
 @activity.defn
 async def ai_orchestrator_activity(task: str) -> str:
-    from strands import Agent
-    from strands.models import BedrockModel
-    
-    agent = Agent(
-        model=BedrockModel(
-            model_id=BEDROCK_MODEL_ID,
-            region_name=AWS_REGION
-        ),
-        system_prompt="""Analyze the user request and return a comma-separated list of activities.
+    normalized = task.lower().strip()
 
-Available: time, weather:city, files, fact:topic
-
-Examples:
-"what time is it" -> "time"
-"weather in tokyo" -> "time,weather:tokyo"
-"show files and weather in london" -> "time,files,weather:london"
+    # Demo-style phrasings don't need a model round trip at all.
+    plan = _fast_plan(normalized)
+    if plan is not None:
+        return plan
 
-Always include 'time' first. Extract cities/topics accurately."""
-    )
-    
     try:
-        result = agent(task)
-        plan = str(result.content if hasattr(result, 'content') else result).strip()
+        plan = _plan_for(normalized)
+        info = _plan_for.cache_info()
+        logger.debug(f"Plan cache: {info.hits} hits / {info.hits + info.misses} lookups")
         return plan
     except Exception as e:
         logger.warning(f"AI orchestrator failed: {e}")
         return "time"  # Safe fallback
 
 
+# Per-step retries inside the fused activity: the old one-activity-per-step
+# layout gave flaky steps (weather above all) their own Temporal retry
+# policy, and because the executor degrades failures into text, the fused
+# activity as a whole succeeds and its policy never kicks in.
+_STEP_ATTEMPTS = 3
+
+
+async def _retry_step(step, *args):
+    for attempt in range(_STEP_ATTEMPTS):
+        try:
+            return await step(*args)
+        except Exception:
+            if attempt == _STEP_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(0.5 * (2 ** attempt))
+
+
+@activity.defn
+async def execute_plan_activity(plan: str) -> str:
+    """Run a whole plan inside one activity, steps in parallel.
+
+    Dispatching each step as its own activity costs a
+    scheduled/started/completed event triplet plus a frontend round trip
+    per step; fusing them keeps the workflow history at two activities
+    (orchestrator + executor) regardless of plan size. Each step retries
+    transient failures internally before being reported unavailable.
+    """
+    labels = []
+    coros = []
+    for activity_name, param in _PLAN_RE.findall(plan):
+        param = param.strip() or None
+
+        if activity_name == 'time':
+            labels.append("Time")
+            coros.append(_retry_step(get_time_activity))
+        elif activity_name == 'weather' and param:
+            labels.append("Weather")
+            coros.append(_retry_step(get_weather_activity, param))
+        elif activity_name == 'files':
+            labels.append("Files")
+            coros.append(_retry_step(list_files_activity))
+        elif activity_name == 'fact' and param:
+            labels.append("Fact")
+            coros.append(_retry_step(get_fact_activity, param))
+
+    raw = await asyncio.gather(*coros, return_exceptions=True)
+
+    results = []
+    for label, value in zip(labels, raw):
+        if isinstance(value, Exception):
+            results.append(f"{label}: unavailable ({value})")
+        else:
+            results.append(f"{label}: {value}")
+    return " | ".join(results)
+
+
 @workflow.defn
 class TemporalAgentWorkflow:
     
     @workflow.run
     async def run(self, task: str) -> str:
         workflow.logger.info(f"Processing: {task}")
-        results = []
-        
+
         # Get execution plan from AI
         plan = await workflow.execute_activity(
             ai_orchestrator_activity,
@@ -97,45 +283,12 @@ class TemporalAgentWorkflow:
             retry_policy=RetryPolicy(maximum_attempts=2)
         )
         
-        # Execute planned activities
-        for activity_spec in plan.split(','):
-            activity_spec = activity_spec.strip()
-            
-            if ':' in activity_spec:
-                activity_name, param = activity_spec.split(':', 1)
-            else:
-                activity_name, param = activity_spec, None
-            
-            # Execute based on activity type
-            if activity_name == 'time':
-                result = await workflow.execute_activity(
-                    get_time_activity,
-                    start_to_close_timeout=timedelta(seconds=5)
-                )
-                results.append(f"Time: {result}")
-            
-            elif activity_name == 'weather' and param:
-                result = await workflow.execute_activity(
-                    get_weather_activity,
-                    param,
-                    start_to_close_timeout=timedelta(seconds=15),
-                    retry_policy=RetryPolicy(maximum_attempts=3)
-                )
-                results.append(f"Weather: {result}")
-            
-            elif activity_name == 'files':
-                result = await workflow.execute_activity(
-                    list_files_activity,
-                    start_to_close_timeout=timedelta(seconds=5)
-                )
-                results.append(f"Files: {result}")
-            
-            elif activity_name == 'fact' and param:
-                result = await workflow.execute_activity(
-                    get_fact_activity,
-                    param,
-                    start_to_close_timeout=timedelta(seconds=20)
-                )
-                results.append(f"Fact: {result}")
-        
-        return " | ".join(results)
+        # Execute the whole plan as one fused activity; its steps still run
+        # concurrently inside the worker, and the history stays at two
+        # activities however long the plan gets.
+        return await workflow.execute_activity(
+            execute_plan_activity,
+            plan,
+            start_to_close_timeout=timedelta(seconds=30),
+            retry_policy=RetryPolicy(maximum_attempts=2)
+        )
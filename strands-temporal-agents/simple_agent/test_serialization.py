@@ -0,0 +1,51 @@
+import dataclasses
+
+import pytest
+
+from serialization import ORJSON_DATA_CONVERTER, OrjsonCompositeConverter
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: str
+
+
+@pytest.fixture
+def converter():
+    return OrjsonCompositeConverter()
+
+
+def test_round_trip_common_values(converter):
+    values = ["hello", {"a": 1, "b": [1, 2]}, None, b"raw", 3.5, True]
+    payloads = converter.to_payloads(values)
+    assert converter.from_payloads(payloads) == values
+
+
+def test_json_payloads_stay_wire_compatible(converter):
+    payload = converter.to_payloads([{"b": 2, "a": 1}])[0]
+    assert payload.metadata["encoding"] == b"json/plain"
+    assert payload.data == b'{"a":1,"b":2}'  # sorted keys, compact separators
+
+
+def test_type_hinted_decode(converter):
+    payloads = converter.to_payloads([_Point(1, "z")])
+    assert converter.from_payloads(payloads, [_Point]) == [_Point(1, "z")]
+
+
+def test_fallback_for_values_orjson_rejects(converter):
+    # Sets aren't JSON: orjson refuses them, but the stock encoder renders
+    # any iterable, so the stdlib fallback path must kick in.
+    payloads = converter.to_payloads([{1, 2, 3}])
+    assert payloads[0].metadata["encoding"] == b"json/plain"
+    assert sorted(converter.from_payloads(payloads)[0]) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_data_converter_round_trip():
+    payloads = await ORJSON_DATA_CONVERTER.encode(["check the weather in tokyo"])
+    assert await ORJSON_DATA_CONVERTER.decode(payloads) == ["check the weather in tokyo"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
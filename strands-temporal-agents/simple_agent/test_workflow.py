@@ -1,5 +1,5 @@
 import pytest
-from temporal_agent import get_time_activity, list_files_activity
+from temporal_agent import get_time_activity, list_files_activity, _fast_plan, _PLAN_RE
 from client import generate_workflow_id
 
 
@@ -17,6 +17,23 @@ async def test_list_files_activity():
     assert ".py" in result
 
 
+def test_fast_plan_classifies_demo_phrasings():
+    assert _fast_plan("what time is it?") == "time"
+    assert _fast_plan("list files") == "time,files"
+    assert _fast_plan("what's the weather in new york?") == "time,weather:new york"
+    assert _fast_plan("tell me a fact about jupiter") == "time,fact:jupiter"
+
+
+def test_fast_plan_defers_ambiguous_tasks():
+    # Anything not matching a whole pattern must go to the model.
+    assert _fast_plan("weather like in paris") is None
+    assert _fast_plan("show files and weather in london") is None
+
+
+def test_plan_regex_absorbs_model_whitespace():
+    assert _PLAN_RE.findall("time, weather: new york") == [("time", ""), ("weather", " new york")]
+
+
 def test_workflow_id_uniqueness():
     wf_id1 = generate_workflow_id("test task")
     wf_id2 = generate_workflow_id("test task")
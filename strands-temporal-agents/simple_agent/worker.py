@@ -3,9 +3,12 @@ import logging
 from temporalio.client import Client
 from temporalio.worker import Worker
 from config import TEMPORAL_HOST, TASK_QUEUE
+from serialization import ORJSON_DATA_CONVERTER
 from temporal_agent import (
     TemporalAgentWorkflow,
+    warm_up,
     ai_orchestrator_activity,
+    execute_plan_activity,
     get_time_activity,
     get_weather_activity,
     list_files_activity,
@@ -17,7 +20,9 @@ logger = logging.getLogger(__name__)
 
 
 async def main():
-    client = await Client.connect(TEMPORAL_HOST)
+    # orjson handles payload (de)serialization; the worker inherits the
+    # client's data converter.
+    client = await Client.connect(TEMPORAL_HOST, data_converter=ORJSON_DATA_CONVERTER)
     
     worker = Worker(
         client,
@@ -25,6 +30,7 @@ async def main():
         workflows=[TemporalAgentWorkflow],
         activities=[
             ai_orchestrator_activity,
+            execute_plan_activity,
             get_time_activity,
             get_weather_activity,
             list_files_activity,
@@ -32,6 +38,10 @@ async def main():
         ]
     )
     
+    # Build the Bedrock agents now so the first task doesn't pay the
+    # import/client-init cold start.
+    warm_up()
+
     logger.info(f"Worker started on queue: {TASK_QUEUE}")
     await worker.run()
 